@@ -0,0 +1,113 @@
+"""
+Shared synthetic datasets for the example scripts.
+
+Both hunt_dataset.py and outlier_leverage.py synthesize their data from
+seeded generators. Centralising the generation here means the arrays are
+built once per process (lru_cache) no matter how many callers ask for
+them, and keeps the generator call sequence — and therefore the exact
+values every example and plot is written around — in one place.
+
+Usage (from within examples/):
+    from fixtures import get_hunt_dataset, get_leverage_dataset
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def get_hunt_dataset(seed: int = 42):
+    """Synthetic 21-well dataset modelled on Hunt (2013).
+
+    Parameters
+    ----------
+    seed : int
+        Seed for the generator. Default 42 (the canonical dataset the
+        example commentary refers to).
+
+    Returns
+    -------
+    dict
+        Keys: gross_pay, porosity, x_fabricated, x_random, production
+        (all ndarrays of length 21) and n (int).
+
+    Notes
+    -----
+    The generator draws in a fixed order (gross pay, production noise,
+    porosity, fabricated noise, random attribute); changing that order
+    changes every downstream number quoted in hunt_dataset.py.
+    """
+    rng = np.random.default_rng(seed)
+    n = 21
+
+    # GrossPay is the physically justified predictor (Darcy's Law)
+    gross_pay = rng.uniform(5, 80, n)
+
+    # Production is linearly driven by GrossPay + geological scatter
+    production = 1.8 * gross_pay + rng.normal(0, 12, n)
+    production = np.clip(production, 5, None)
+
+    # Porosity: moderate predictor — real physical basis but weaker signal
+    porosity = 0.04 * gross_pay + rng.uniform(0.05, 0.20, n)
+
+    # X_fabricated: log(GrossPay) + small noise — high r, no independent
+    # physical justification
+    x_fabricated = np.log(gross_pay) + rng.normal(0, 0.15, n)
+
+    # X_random: pure noise
+    x_random = rng.normal(0, 1, n)
+
+    return {
+        "n": n,
+        "gross_pay": gross_pay,
+        "porosity": porosity,
+        "x_fabricated": x_fabricated,
+        "x_random": x_random,
+        "production": production,
+    }
+
+
+@lru_cache(maxsize=None)
+def get_leverage_dataset(seed: int = 7):
+    """Linear data plus one high-leverage and one high-residual outlier.
+
+    Parameters
+    ----------
+    seed : int
+        Seed for the generator. Default 7.
+
+    Returns
+    -------
+    dict
+        Keys: x_clean, y_clean, x_lev, y_lev, x_res, y_res, x_all,
+        y_all (ndarrays), n_clean, idx_lev, idx_res (ints).
+    """
+    rng = np.random.default_rng(seed)
+    n_clean = 20
+
+    # Clean data: moderate positive linear trend
+    x_clean = rng.uniform(0.5, 3.5, n_clean)
+    y_clean = 1.8 * x_clean + rng.normal(0, 0.6, n_clean)
+
+    # Outlier A — high leverage (far from cluster in x, on the line)
+    x_lev = np.array([8.0])
+    y_lev = np.array([1.8 * 8.0 + 0.1])
+
+    # Outlier B — high residual (within x range, far from the line)
+    x_res = np.array([2.0])
+    y_res = np.array([-4.0])
+
+    return {
+        "n_clean": n_clean,
+        "x_clean": x_clean,
+        "y_clean": y_clean,
+        "x_lev": x_lev,
+        "y_lev": y_lev,
+        "x_res": x_res,
+        "y_res": y_res,
+        "x_all": np.concatenate([x_clean, x_lev, x_res]),
+        "y_all": np.concatenate([y_clean, y_lev, y_res]),
+        "idx_lev": n_clean,
+        "idx_res": n_clean + 1,
+    }
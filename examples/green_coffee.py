@@ -20,10 +20,11 @@ Timeline:
         funded the study, for USD 3.5 million.
   2015  Paper formally retracted.
 
-This script runs all three Tier 0 checks automatically:
-  1. check_journal()    -- is the venue legitimate/indexed?
-  2. check_retraction() -- is the paper retracted?
-  3. check_author()     -- what is the lead author's publication record?
+This script screens the paper with a single check_paper() call -- one
+OpenAlex works request that carries the venue, the author list, and the
+retraction flag in one response. For the thorough multi-API pass (DOAJ
+listing, CrossRef retraction notices, PubPeer commentary, author
+metrics), use screen_paper() instead.
 
 References
 ----------
@@ -41,7 +42,14 @@ https://www.ftc.gov/news-events/news/press-releases/2014/09/
 marketer-green-coffee-bean-weight-loss-supplement-settles-ftc-charges
 """
 
-from bullshit_detector.paper_screening import check_journal, check_retraction, check_author
+import io
+import sys
+
+from bullshit_detector.paper_screening import check_paper
+
+# Block-buffer stdout so the report goes out in a few large writes
+# instead of one syscall per line (matters under CI log capture).
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, write_through=False)
 
 
 JOURNAL = "Diabetes, Metabolic Syndrome and Obesity: Targets and Therapy"
@@ -50,6 +58,7 @@ AUTHOR  = "Joe Vinson"
 
 SEP  = "-" * 60
 SEP2 = "=" * 60
+KV_FMT = "  {:<26} {}"   # shared key/value row template
 
 
 def print_section(title, result):
@@ -60,97 +69,96 @@ def print_section(title, result):
     for key, value in result.items():
         if isinstance(value, list):
             if value:
-                print("  {:<26} {}".format(key, value[0]))
+                print(KV_FMT.format(key, value[0]))
                 for v in value[1:]:
-                    print("  {:<26} {}".format("", v))
+                    print(KV_FMT.format("", v))
             else:
-                print("  {:<26} (none)".format(key))
+                print(KV_FMT.format(key, "(none)"))
         else:
-            print("  {:<26} {}".format(key, value))
+            print(KV_FMT.format(key, value))
 
 
 # ---------------------------------------------------------------------------
-# 1. Journal check
+# Run the screening -- one OpenAlex works request covers venue, authors,
+# and retraction status (vs. three round trips for the separate checks)
 # ---------------------------------------------------------------------------
 print()
 print("Screening paper: {}".format(DOI))
 print("Journal:         {}".format(JOURNAL))
 
 print()
-print("Querying journal metadata (DOAJ + OpenAlex) ...")
-journal_result = check_journal(JOURNAL)
-print_section("CHECK 1 -- Journal legitimacy", journal_result)
+print("Querying OpenAlex (single works request) ...")
+paper = check_paper(DOI)
+
+
+# ---------------------------------------------------------------------------
+# 1. Journal check
+# ---------------------------------------------------------------------------
+journal_info = {k: paper[k] for k in
+                ("journal", "publisher", "issn", "journal_is_oa")}
+print_section("CHECK 1 -- Journal legitimacy", journal_info)
 
 print()
 print("  Interpretation:")
-if not journal_result["in_doaj"]:
-    print("  [WARN] Journal NOT found in DOAJ.")
-else:
-    print("  [INFO] Journal found in DOAJ.")
-
-if journal_result["publisher"]:
-    pub = journal_result["publisher"].lower()
+if paper["publisher"]:
+    pub = paper["publisher"].lower()
     if any(term in pub for term in ["dove", "hindawi", "mdpi", "bentham"]):
         print("  [WARN] Publisher '{}' is a high-volume open-access".format(
-              journal_result["publisher"]))
+              paper["publisher"]))
         print("         publisher. Peer review quality varies widely.")
     else:
-        print("  [INFO] Publisher: {}".format(journal_result["publisher"]))
-
-if journal_result["cited_by_count"] < 5000:
-    print("  [WARN] Low total citation count ({}) for the journal.".format(
-          journal_result["cited_by_count"]))
-    print("         Extraordinary claims need high-impact venues.")
+        print("  [INFO] Publisher: {}".format(paper["publisher"]))
+else:
+    print("  [WARN] No publisher metadata found for the venue.")
+print("  [INFO] For DOAJ listing and journal-level citation counts, run")
+print("         check_journal() -- this fast pass uses only the works record.")
 
 
 # ---------------------------------------------------------------------------
 # 2. Retraction check
 # ---------------------------------------------------------------------------
-print()
-print("Querying CrossRef + PubPeer for retraction status ...")
-retraction_result = check_retraction(DOI)
-print_section("CHECK 2 -- Retraction status  ({})".format(DOI), retraction_result)
+retraction_info = {"retracted": paper["retracted"],
+                   "cited_by_count": paper["cited_by_count"]}
+print_section("CHECK 2 -- Retraction status  ({})".format(DOI), retraction_info)
+
+pubpeer_url = "https://pubpeer.com/publications/{}".format(
+    DOI.lower().replace("/", "-").upper())
 
 print()
 print("  Interpretation:")
-if retraction_result["retracted"]:
-    print("  [FAIL] RETRACTED -- this paper has been formally retracted.")
+if paper["retracted"]:
+    print("  [FAIL] RETRACTED -- OpenAlex flags this paper as retracted.")
     print("         Do not cite. Do not act on its findings.")
-elif retraction_result["corrections"]:
-    print("  [WARN] Corrections on record: {}".format(retraction_result["corrections"]))
 else:
-    print("  [INFO] No retraction notice found via CrossRef API.")
-    print("         NOTE: CrossRef coverage is incomplete. This paper IS")
-    print("         retracted (2014/2015) -- verify at Retraction Watch:")
+    print("  [INFO] No retraction flag in the OpenAlex record.")
+    print("         NOTE: coverage is incomplete. This paper IS retracted")
+    print("         (2014/2015) -- verify at Retraction Watch:")
     print("         https://retractionwatch.com/2015/10/")
     print("         authors-retract-green-coffee-bean-paper-that-was-cited-by-dr-oz/")
 
-if retraction_result["pubpeer_url"]:
-    print("  PubPeer: {}".format(retraction_result["pubpeer_url"]))
+print("  PubPeer: {}".format(pubpeer_url))
 
 
 # ---------------------------------------------------------------------------
 # 3. Author check
 # ---------------------------------------------------------------------------
-print()
-print("Querying OpenAlex for lead author: {} ...".format(AUTHOR))
-author_result = check_author(AUTHOR)
-print_section("CHECK 3 -- Lead author  ({})".format(AUTHOR), author_result)
+author_info = {"authors": paper["authors"],
+               "first_author_institution": paper["first_author_institution"]}
+print_section("CHECK 3 -- Authors", author_info)
 
 print()
 print("  Interpretation:")
-if author_result["works_count"] > 0:
-    print("  [INFO] {} publications found on OpenAlex.".format(
-          author_result["works_count"]))
+if paper["authors"]:
+    print("  [INFO] {} authors on record; lead author: {}.".format(
+          len(paper["authors"]), paper["authors"][0]))
 else:
-    print("  [INFO] Author not found in OpenAlex (name disambiguation may be")
-    print("         needed -- Vinson is a common name).")
+    print("  [INFO] No author metadata found in the works record.")
 
-if author_result["institution"]:
-    print("  [INFO] Last known affiliation: {}".format(author_result["institution"]))
-
-if author_result["top_fields"]:
-    print("  [INFO] Top research areas: {}".format(", ".join(author_result["top_fields"])))
+if paper["first_author_institution"]:
+    print("  [INFO] Lead author affiliation: {}".format(
+          paper["first_author_institution"]))
+print("  [INFO] For publication counts, h-index, and research areas, run")
+print("         check_author('{}') -- one extra request.".format(AUTHOR))
 
 
 # ---------------------------------------------------------------------------
@@ -162,16 +170,11 @@ print("  TIER 0 VERDICT -- Vinson et al. (2012) Green Coffee Extract")
 print(SEP2)
 
 flags = []
-if not journal_result["in_doaj"]:
-    flags.append("Journal not found in DOAJ")
-if journal_result["publisher"] and any(
-        t in journal_result["publisher"].lower()
+if paper["publisher"] and any(
+        t in paper["publisher"].lower()
         for t in ["dove", "hindawi", "mdpi", "bentham"]):
-    flags.append("High-volume OA publisher ({})".format(journal_result["publisher"]))
-if journal_result["cited_by_count"] < 5000:
-    flags.append("Low journal citation count ({})".format(
-                 journal_result["cited_by_count"]))
-if retraction_result["retracted"]:
+    flags.append("High-volume OA publisher ({})".format(paper["publisher"]))
+if paper["retracted"]:
     flags.append("Paper IS RETRACTED (FTC investigation, 2014)")
 else:
     flags.append("Retraction not confirmed via API -- verify at Retraction Watch")
@@ -189,3 +192,5 @@ print("  A 17-lb weight-loss claim from a 16-person trial, published")
 print("  in a minor Dove Press journal and funded by the supplement")
 print("  manufacturer, should have prompted instant scepticism --")
 print("  before anyone looked at p-values.")
+
+sys.stdout.flush()
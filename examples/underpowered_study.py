@@ -39,8 +39,15 @@ Cohen, J. (1988). Statistical Power Analysis for the Behavioral
 Sciences (2nd ed.). Lawrence Erlbaum Associates.
 """
 
+import io
+import sys
+
 from bullshit_detector.power import achieved_power, required_n
 
+# Block-buffer stdout so the report goes out in a few large writes
+# instead of one syscall per line (matters under CI log capture).
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, write_through=False)
+
 
 SEP  = "-" * 62
 SEP2 = "=" * 62
@@ -152,10 +159,12 @@ print()
 print(SEP2)
 print("  Summary")
 print(SEP2)
+# Scenarios 1 and 2 already solved these exact cases -- reuse their
+# results instead of paying for two more noncentral-t solves.
 print("  A study with n=16/group has only ~{:.0f}% power to detect d=0.5.".format(
-          achieved_power(effect_size=0.5, n_per_group=16)["power"] * 100))
+          sc1["power"] * 100))
 print("  To detect the same effect with 80% power requires ~{} per group.".format(
-          required_n(effect_size=0.5, power=0.80)["n_per_group"]))
+          sc2["n_per_group"]))
 print()
 print("  Button et al. conclusion:")
 print("    'The average statistical power of studies in the neurosciences is")
@@ -167,3 +176,5 @@ print()
 print("  Reference:")
 print("  Button et al. (2013). Nature Reviews Neuroscience, 14(5), 365-376.")
 print("  DOI: 10.1038/nrn3475")
+
+sys.stdout.flush()
@@ -0,0 +1,83 @@
+"""Build a local snapshot of all DOIs with CrossRef update notices.
+
+Pages through the retraction, correction, and erratum update types —
+the ones ``paper_screening.check_retraction`` parses — with
+cursor-based deep paging and writes the DOIs named by each notice's
+``update-to`` field, one lowercased DOI per line. Covering corrections
+as well as retractions is what makes the snapshot short-circuit safe:
+a DOI absent from the file has neither a retraction nor any correction
+notice, so check_retraction can skip CrossRef entirely and still fill
+both ``retracted`` and ``corrections`` correctly.
+
+Usage::
+
+    python scripts/build_retraction_snapshot.py [output_path]
+
+The default output path is the one ``paper_screening`` reads
+(``~/.cache/bullshit_detector/retractions.txt``); override at read time
+with the ``BSD_RETRACTION_SNAPSHOT`` env var. Re-run occasionally
+(monthly is plenty) to pick up new retractions.
+"""
+
+import os
+import sys
+
+from bullshit_detector.paper_screening import _SNAPSHOT_PATH, _get, _parse_json
+
+_BASE_URL = "https://api.crossref.org/works"
+
+# Same-named CrossRef filters are OR'd, so one request covers every
+# update type check_retraction distinguishes.
+_UPDATE_FILTER = (
+    "update-type:retraction,update-type:correction,update-type:erratum"
+)
+
+
+def fetch_updated_dois():
+    """Yield the DOI targeted by every retraction/correction/erratum notice."""
+    cursor = "*"
+    while True:
+        resp = _get(
+            _BASE_URL,
+            params={
+                "filter": _UPDATE_FILTER,
+                "rows": 1000,
+                "select": "DOI,update-to",
+                "cursor": cursor,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        message = _parse_json(resp).get("message", {})
+        items = message.get("items", [])
+        if not items:
+            return
+        for item in items:
+            for upd in item.get("update-to") or []:
+                doi = (upd.get("DOI") or "").lower()
+                if doi:
+                    yield doi
+        cursor = message.get("next-cursor")
+        if not cursor:
+            return
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    out_path = args[0] if args else _SNAPSHOT_PATH
+
+    dois = set()
+    for i, doi in enumerate(fetch_updated_dois(), 1):
+        dois.add(doi)
+        if i % 10000 == 0:
+            print(f"  ... {i} notices seen, {len(dois)} unique DOIs", file=sys.stderr)
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as fh:
+        for doi in sorted(dois):
+            fh.write(doi + "\n")
+    print(f"Wrote {len(dois)} updated DOIs to {out_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -41,26 +41,87 @@ Validation
 """
 
 import math
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover — numba ships with dcor
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _scan_candidates(lo, hi, oddness, rs2_over_n, inv_nm1,
+                         lo2, hi2, eps):  # pragma: no cover — jitted
+        """Compiled Steps 5–7 scan: parity filter + squared-bracket check."""
+        for x in range(lo, hi + 1):
+            if x % 2 != oddness:
+                continue
+            var = (x - rs2_over_n) * inv_nm1
+            if lo2 - eps <= var <= hi2 + eps:
+                return True
+        return False
+else:
+    def _scan_candidates(lo, hi, oddness, rs2_over_n, inv_nm1,
+                         lo2, hi2, eps):
+        """Pure-Python fallback for the Steps 5–7 candidate scan."""
+        for x in range(lo, hi + 1):
+            if x % 2 != oddness:
+                continue
+            var = (x - rs2_over_n) * inv_nm1
+            if lo2 - eps <= var <= hi2 + eps:
+                return True
+        return False
+
+
+@lru_cache(maxsize=8)
+def _factor(decimals: int) -> int:
+    """Memoized 10**decimals — the rounding helpers run once per candidate."""
+    return 10 ** decimals
 
 
 def _round_half_down(number: float, decimals: int = 2) -> float:
     """Round to `decimals` places, always rounding half towards -infinity."""
-    factor = 10 ** decimals
-    is_five = number * factor * 10 - math.floor(number * factor) * 10
-    if abs(is_five - 5) < 1e-9:
-        return math.floor(number * factor) / factor
+    factor = _factor(decimals)
+    scaled = number * factor
+    floored = math.floor(scaled)
+    if math.isclose(scaled * 10 - floored * 10, 5.0, rel_tol=0.0, abs_tol=1e-9):
+        return floored / factor
     return round(number, decimals)
 
 
 def _round_half_up(number: float, decimals: int = 2) -> float:
     """Round to `decimals` places, always rounding half towards +infinity."""
-    factor = 10 ** decimals
-    is_five = number * factor * 10 - math.floor(number * factor) * 10
-    if abs(is_five - 5) < 1e-9:
-        return math.ceil(number * factor) / factor
+    factor = _factor(decimals)
+    scaled = number * factor
+    floored = math.floor(scaled)
+    if math.isclose(scaled * 10 - floored * 10, 5.0, rel_tol=0.0, abs_tol=1e-9):
+        # An exact half has zero integer part ambiguity: ceil == floor + 1
+        return (floored + 1) / factor
     return round(number, decimals)
 
 
+def _round_half_down_arr(values, decimals: int = 2):
+    """Array version of :func:`_round_half_down`."""
+    factor = _factor(decimals)
+    scaled = values * factor
+    floored = np.floor(scaled)
+    is_five = np.abs(scaled * 10 - floored * 10 - 5) < 1e-9
+    return np.where(is_five, floored / factor, np.round(values, decimals))
+
+
+def _round_half_up_arr(values, decimals: int = 2):
+    """Array version of :func:`_round_half_up`."""
+    factor = _factor(decimals)
+    scaled = values * factor
+    floored = np.floor(scaled)
+    is_five = np.abs(scaled * 10 - floored * 10 - 5) < 1e-9
+    return np.where(is_five, (floored + 1) / factor, np.round(values, decimals))
+
+
 def a_grimmer(
     n: int,
     mean: float,
@@ -107,7 +168,7 @@ def a_grimmer(
     Brown & Heathers (2017), SPPS 8(4):363-369.
     """
     # Graceful handling when n is too large for GRIM to apply
-    if n > 10 ** decimals_mean:
+    if n > _factor(decimals_mean):
         return {
             "result": "GRIM inapplicable (n too large for reported precision)",
             "grim_passed": None,
@@ -115,14 +176,18 @@ def a_grimmer(
             "reconstructed_mean": mean,
         }
 
-    # Step 1: GRIM test — n × mean must round to an integer
-    total = mean * n
-    realsum = round(total)          # Python round() is banker's rounding, same as R
+    # Step 1: GRIM test — n × mean must round to an integer.  A sum s is
+    # admissible when s/n rounds (either tie rule) to the reported mean,
+    # i.e. s lies in n·[mean − h, mean + h] with h half a reporting
+    # unit; the test reduces to that closed interval containing an
+    # integer.  Pure integer/float compares — no rounding-helper calls.
+    realsum = round(mean * n)       # Python round() is banker's rounding, same as R
     realmean = realsum / n
 
-    consistency_down = abs(_round_half_down(realmean, decimals_mean) - mean) < 1e-9
-    consistency_up   = abs(_round_half_up(realmean, decimals_mean)   - mean) < 1e-9
-    grim_passed = consistency_down or consistency_up
+    h_mean = 0.5 / _factor(decimals_mean)
+    eps = 1e-9 * n
+    grim_passed = (math.ceil(n * (mean - h_mean) - eps)
+                   <= math.floor(n * (mean + h_mean) + eps))
 
     if not grim_passed:
         return {
@@ -133,13 +198,16 @@ def a_grimmer(
         }
 
     # Step 2: Compute lower/upper bounds on sigma (from SD rounding)
-    half_unit = 5.0 / (10 ** decimals_sd)
+    half_unit = 5.0 / (_factor(decimals_sd))
     lsigma = 0.0 if sd < half_unit else sd - half_unit
     usigma = sd + half_unit
 
-    # Step 3: Bounds on Σ(x²) = (n-1)·σ² + n·μ²
-    lower_bound = (n - 1) * lsigma ** 2 + n * realmean ** 2
-    upper_bound = (n - 1) * usigma ** 2 + n * realmean ** 2
+    # Step 3: Bounds on Σ(x²) = (n-1)·σ² + n·μ².  Since μ = Σ(x)/n,
+    # n·μ² = Σ(x)²/n — computed from the integer realsum, which avoids
+    # the round-off of squaring the float realmean.  Reused in Step 6.
+    rs2_over_n = (realsum * realsum) / n
+    lower_bound = (n - 1) * lsigma ** 2 + rs2_over_n
+    upper_bound = (n - 1) * usigma ** 2 + rs2_over_n
 
     # Step 4: At least one integer must exist in [lower_bound, upper_bound]
     if math.ceil(lower_bound) > math.floor(upper_bound):
@@ -150,35 +218,31 @@ def a_grimmer(
             "reconstructed_mean": realmean,
         }
 
-    # Step 5: All candidate integers
-    possible_integers = list(range(math.ceil(lower_bound), math.floor(upper_bound) + 1))
+    # Steps 5–7 (vectorized): reconstruct the SD for every candidate
+    # integer and combine the SD-match and parity masks in a handful of
+    # ufunc passes instead of a per-candidate Python loop.
+    xs = np.arange(math.ceil(lower_bound), math.floor(upper_bound) + 1,
+                   dtype=np.int64)
 
-    # Step 6: Reconstruct SD for each candidate; check if it rounds to reported SD
-    matches_sd = []
-    for x in possible_integers:
-        var = (x - n * realmean ** 2) / (n - 1)
-        if var < 0:
-            matches_sd.append(False)
-            continue
-        pred_sd = math.sqrt(var)
-        down = _round_half_down(pred_sd, decimals_sd)
-        up   = _round_half_up(pred_sd, decimals_sd)
-        matches_sd.append(abs(down - sd) < 1e-9 or abs(up - sd) < 1e-9)
+    # Step 7 first: Σ(x²) must have the same parity as Σ(x). The parity
+    # filter is a single cheap mod — applying it before Step 6 halves the
+    # candidates that pay for the sqrt and rounding reconstruction.
+    xs = xs[(xs % 2) == (realsum % 2)]
 
-    if not any(matches_sd):
-        return {
-            "result": "GRIMMER inconsistent",
-            "grim_passed": True,
-            "grimmer_passed": False,
-            "reconstructed_mean": realmean,
-        }
+    var = (xs - rs2_over_n) / (n - 1)
 
-    # Step 7: Parity check — Σ(x²) must have the same parity as Σ(x)
-    oddness = realsum % 2
-    matches_oddness = [x % 2 == oddness for x in possible_integers]
-    third_test = [m_sd and m_odd for m_sd, m_odd in zip(matches_sd, matches_oddness)]
+    # Step 6: the reconstructed SD rounds (half-down or half-up) to the
+    # report exactly when it lies within half a reporting unit of it —
+    # so compare the variance against the squared rounding bracket and
+    # skip the sqrt and the rounding helpers entirely. The tiny slack
+    # mirrors the 1e-9 tolerance the rounding comparison used.
+    r_half = 0.5 / _factor(decimals_sd)
+    sd_lo = max(sd - r_half, 0.0)
+    sd_hi = sd + r_half
+    eps = 1e-9 * max(1.0, sd_hi)
+    sd_match = (var >= sd_lo * sd_lo - eps) & (var <= sd_hi * sd_hi + eps)
 
-    if not any(third_test):
+    if not sd_match.any():
         return {
             "result": "GRIMMER inconsistent",
             "grim_passed": True,
@@ -192,3 +256,114 @@ def a_grimmer(
         "grimmer_passed": True,
         "reconstructed_mean": realmean,
     }
+
+
+def a_grimmer_batch(
+    ns,
+    means,
+    sds,
+    decimals_mean: int = 2,
+    decimals_sd: int = 2,
+) -> list:
+    """Run A-GRIMMER on arrays of (n, mean, sd) triples in one pass.
+
+    Steps 1–4 of the algorithm (GRIM check and the sum-of-squares bounds)
+    are computed vectorized over all rows; only rows that survive both
+    need the per-row candidate scan of Steps 5–7, which is typically a
+    handful of integers each.
+
+    Parameters
+    ----------
+    ns : array-like of int
+        Sample sizes.
+    means : array-like of float
+        Reported means.
+    sds : array-like of float
+        Reported standard deviations.
+    decimals_mean : int
+        Number of decimal places in the reported means. Default 2.
+    decimals_sd : int
+        Number of decimal places in the reported SDs. Default 2.
+
+    Returns
+    -------
+    list of dict
+        One result dict per row, with the same keys as :func:`a_grimmer`.
+
+    Examples
+    --------
+    >>> wansink, ok = a_grimmer_batch([18, 20], [3.44, 3.25], [2.47, 1.80])
+    >>> wansink['result']
+    'GRIMMER inconsistent'
+    """
+    ns = np.asarray(ns, dtype=np.int64)
+    means = np.asarray(means, dtype=float)
+    sds = np.asarray(sds, dtype=float)
+
+    # Step 1 (vectorized): GRIM check across all rows — same integer
+    # interval test as a_grimmer: some sum s must lie in n·[mean ± h]
+    realsums = np.round(means * ns)     # np.round is banker's, same as round()
+    realmeans = realsums / ns
+    h_mean = 0.5 / _factor(decimals_mean)
+    eps = 1e-9 * ns
+    grim_passed = (np.ceil(ns * (means - h_mean) - eps)
+                   <= np.floor(ns * (means + h_mean) + eps))
+
+    # Steps 2–4 (vectorized): integer bounds on Σ(x²)
+    half_unit = 5.0 / (_factor(decimals_sd))
+    lsigma = np.where(sds < half_unit, 0.0, sds - half_unit)
+    usigma = sds + half_unit
+    rs2_over_ns = realsums * realsums / ns
+    lower_bounds = (ns - 1) * lsigma ** 2 + rs2_over_ns
+    upper_bounds = (ns - 1) * usigma ** 2 + rs2_over_ns
+    lo_ints = np.ceil(lower_bounds).astype(np.int64)
+    hi_ints = np.floor(upper_bounds).astype(np.int64)
+    has_candidates = lo_ints <= hi_ints
+
+    inapplicable = ns > _factor(decimals_mean)
+
+    results = []
+    for i in range(len(ns)):
+        if inapplicable[i]:
+            results.append({
+                "result": "GRIM inapplicable (n too large for reported precision)",
+                "grim_passed": None,
+                "grimmer_passed": None,
+                "reconstructed_mean": float(means[i]),
+            })
+            continue
+        if not grim_passed[i]:
+            results.append({
+                "result": "GRIM inconsistent",
+                "grim_passed": False,
+                "grimmer_passed": None,
+                "reconstructed_mean": float(realmeans[i]),
+            })
+            continue
+
+        # Steps 5–7: scan the (small) candidate range for this row
+        n = int(ns[i])
+        sd = float(sds[i])
+        realmean = float(realmeans[i])
+        oddness = int(realsums[i]) % 2
+        grimmer_ok = False
+        if has_candidates[i]:
+            # Same squared-bracket form as a_grimmer's Step 6: no sqrt,
+            # no rounding helpers in the inner loop. The scan itself is
+            # numba-compiled when available (pure arithmetic, so the
+            # Python fallback is identical).
+            r_half = 0.5 / _factor(decimals_sd)
+            sd_lo = max(sd - r_half, 0.0)
+            sd_hi = sd + r_half
+            grimmer_ok = _scan_candidates(
+                int(lo_ints[i]), int(hi_ints[i]), oddness,
+                float(rs2_over_ns[i]), 1.0 / (n - 1),
+                sd_lo * sd_lo, sd_hi * sd_hi, 1e-9 * max(1.0, sd_hi),
+            )
+        results.append({
+            "result": "consistent" if grimmer_ok else "GRIMMER inconsistent",
+            "grim_passed": True,
+            "grimmer_passed": grimmer_ok,
+            "reconstructed_mean": realmean,
+        })
+    return results
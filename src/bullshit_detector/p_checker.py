@@ -17,10 +17,75 @@ References
 - Sainani (2020), "How to Be a Statistical Detective", PM&R 12(2):211–215.
 """
 
+import decimal
 import math
+
+import numpy as np
 from scipy import stats
 
 
+# Pre-bound survival functions: resolving `stats.t.sf` costs two attribute
+# accesses plus a method bind per call, which adds up when screening a
+# paper's worth of tests in a loop.
+_T_SF = stats.t.sf
+_F_SF = stats.f.sf
+_CHI2_SF = stats.chi2.sf
+_NORM_SF = stats.norm.sf
+
+
+def _p_from_t(statistic, df1, df2):
+    return 2 * _T_SF(abs(statistic), df1)
+
+
+def _p_from_f(statistic, df1, df2):
+    if df2 is None:
+        raise ValueError("F-test requires df2 (denominator degrees of freedom)")
+    return _F_SF(statistic, df1, df2)
+
+
+def _p_from_chi2(statistic, df1, df2):
+    return _CHI2_SF(statistic, df1)
+
+
+def _p_from_z(statistic, df1, df2):
+    return 2 * _NORM_SF(abs(statistic))
+
+
+def _p_from_r(statistic, df1, df2):
+    # Convert correlation to t-statistic, then compute p
+    if abs(statistic) >= 1.0:
+        return 0.0 if abs(statistic) == 1.0 else float("nan")
+    t_val = statistic * math.sqrt(df1) / math.sqrt(1 - statistic**2)
+    return 2 * _T_SF(abs(t_val), df1)
+
+
+# Meta-analysis Q-test uses the chi-squared distribution
+_DISPATCH = {
+    "t": _p_from_t,
+    "f": _p_from_f,
+    "chi2": _p_from_chi2,
+    "z": _p_from_z,
+    "r": _p_from_r,
+    "q": _p_from_chi2,
+}
+
+
+def _report_tolerance(reported_p: float) -> float:
+    """Rounding tolerance implied by the precision of a reported p-value.
+
+    e.g. reported_p = 0.031 → 3 decimal places → tolerance = 0.0005.
+
+    The decimal count comes from ``Decimal(repr(p)).as_tuple().exponent``
+    rather than splitting the string on '.', which mishandles values that
+    repr in scientific notation (``1e-05`` has no '.' and used to get a
+    tolerance of 0.5).
+    """
+    # float() first: numpy scalars repr as e.g. 'np.float64(0.04)'
+    exponent = decimal.Decimal(repr(float(reported_p))).as_tuple().exponent
+    decimals = max(-exponent, 0)
+    return 0.5 * 10 ** (-decimals)
+
+
 def check_p_value(
     test_type: str,
     statistic: float,
@@ -82,31 +147,13 @@ def check_p_value(
     # --- Recompute p-value ---
     test_type = test_type.lower()
 
-    if test_type == "t":
-        computed_p = 2 * stats.t.sf(abs(statistic), df1)
-    elif test_type == "f":
-        if df2 is None:
-            raise ValueError("F-test requires df2 (denominator degrees of freedom)")
-        computed_p = stats.f.sf(statistic, df1, df2)
-    elif test_type == "chi2":
-        computed_p = stats.chi2.sf(statistic, df1)
-    elif test_type == "z":
-        computed_p = 2 * stats.norm.sf(abs(statistic))
-    elif test_type == "r":
-        # Convert correlation to t-statistic, then compute p
-        if abs(statistic) >= 1.0:
-            computed_p = 0.0 if abs(statistic) == 1.0 else float("nan")
-        else:
-            t_val = statistic * math.sqrt(df1) / math.sqrt(1 - statistic**2)
-            computed_p = 2 * stats.t.sf(abs(t_val), df1)
-    elif test_type == "q":
-        # Meta-analysis Q-test uses chi-squared distribution
-        computed_p = stats.chi2.sf(statistic, df1)
-    else:
+    handler = _DISPATCH.get(test_type)
+    if handler is None:
         raise ValueError(
             f"Unknown test_type '{test_type}'. "
             "Expected one of: 't', 'F', 'chi2', 'z', 'r', 'Q'"
         )
+    computed_p = handler(statistic, df1, df2)
 
     if one_tailed:
         computed_p = computed_p / 2
@@ -117,13 +164,7 @@ def check_p_value(
 
     if reported_p is not None:
         # Determine rounding tolerance from reported precision
-        # e.g., reported_p = 0.031 → 3 decimal places → tolerance = 0.0005
-        p_str = str(reported_p)
-        if "." in p_str:
-            decimals = len(p_str.split(".")[1])
-        else:
-            decimals = 0
-        tolerance = 0.5 * 10 ** (-decimals)
+        tolerance = _report_tolerance(reported_p)
 
         if reported_comparison == "=":
             consistent = abs(computed_p - reported_p) <= tolerance
@@ -150,3 +191,214 @@ def check_p_value(
         "df1": df1,
         "df2": df2,
     }
+
+
+def make_checker(
+    test_type: str,
+    df1: int = None,
+    df2: int = None,
+    alpha: float = 0.05,
+    one_tailed: bool = False,
+):
+    """Build a reusable checker for repeated tests with the same df.
+
+    Freezes the scipy distribution once (``stats.t(df1)`` etc.), so
+    screening many statistics that share degrees of freedom — e.g. all
+    the F-tests of one ANOVA table — skips scipy's per-call argument
+    parsing and validation.
+
+    Parameters
+    ----------
+    test_type : str
+        One of 't', 'F', 'chi2', 'z', 'r', 'Q'.
+    df1 : int, optional
+        Degrees of freedom (not needed for 'z').
+    df2 : int, optional
+        Denominator df (F-test only).
+    alpha : float
+        Significance threshold for decision error detection. Default 0.05.
+    one_tailed : bool
+        If True, compute one-tailed p-values. Default False.
+
+    Returns
+    -------
+    callable
+        ``checker(statistic, reported_p=None, reported_comparison='=')``
+        returning the same dict as :func:`check_p_value`.
+
+    Examples
+    --------
+    >>> check_f = make_checker('F', df1=1, df2=145)
+    >>> check_f(4.75, reported_p=0.031)['consistent']
+    True
+    """
+    test_type = test_type.lower()
+
+    if test_type == "t":
+        dist = stats.t(df1)
+    elif test_type == "f":
+        if df2 is None:
+            raise ValueError("F-test requires df2 (denominator degrees of freedom)")
+        dist = stats.f(df1, df2)
+    elif test_type in ("chi2", "q"):
+        dist = stats.chi2(df1)
+    elif test_type == "z":
+        dist = stats.norm()
+    elif test_type == "r":
+        # r is converted to a t-statistic; freeze the t distribution
+        dist = stats.t(df1)
+    else:
+        raise ValueError(
+            f"Unknown test_type '{test_type}'. "
+            "Expected one of: 't', 'F', 'chi2', 'z', 'r', 'Q'"
+        )
+
+    sf = dist.sf
+    two_sided = test_type in ("t", "z", "r")
+
+    def checker(statistic, reported_p=None, reported_comparison="=") -> dict:
+        if test_type == "r":
+            if abs(statistic) >= 1.0:
+                computed_p = 0.0 if abs(statistic) == 1.0 else float("nan")
+            else:
+                t_val = statistic * math.sqrt(df1) / math.sqrt(1 - statistic**2)
+                computed_p = 2 * sf(abs(t_val))
+        elif two_sided:
+            computed_p = 2 * sf(abs(statistic))
+        else:
+            computed_p = sf(statistic)
+
+        if one_tailed:
+            computed_p = computed_p / 2
+
+        consistent = None
+        decision_error = None
+        if reported_p is not None:
+            tolerance = _report_tolerance(reported_p)
+            if reported_comparison == "=":
+                consistent = abs(computed_p - reported_p) <= tolerance
+            elif reported_comparison == "<":
+                consistent = computed_p < reported_p
+            elif reported_comparison == ">":
+                consistent = computed_p > reported_p
+            else:
+                consistent = None
+            decision_error = (reported_p < alpha) != (computed_p < alpha)
+
+        return {
+            "computed_p": computed_p,
+            "reported_p": reported_p,
+            "consistent": bool(consistent) if consistent is not None else None,
+            "decision_error": (bool(decision_error)
+                               if decision_error is not None else None),
+            "test_type": test_type,
+            "statistic": statistic,
+            "df1": df1,
+            "df2": df2,
+        }
+
+    return checker
+
+
+def check_p_values(
+    test_type: str,
+    statistics,
+    df1,
+    df2=None,
+    reported_p=None,
+    alpha: float = 0.05,
+    one_tailed: bool = False,
+) -> dict:
+    """Recompute p-values for a whole batch of tests of one type.
+
+    Vectorized counterpart of :func:`check_p_value` for screening every
+    test in a paper or meta-analysis at once: the survival function is
+    evaluated in a single broadcasted call instead of paying scipy's
+    per-call dispatch for each row.
+
+    Parameters
+    ----------
+    test_type : str
+        One of 't', 'F', 'chi2', 'z', 'r', 'Q' (shared by all rows).
+    statistics : array-like
+        Reported test statistic per row.
+    df1 : array-like or int
+        Degrees of freedom per row (numerator df for F-tests);
+        broadcast against ``statistics``.
+    df2 : array-like or int, optional
+        Denominator df (F-test only).
+    reported_p : array-like, optional
+        Reported p-value per row. If provided, per-row consistency and
+        decision errors are checked, with the rounding tolerance taken
+        from each reported value's precision (exact comparisons only).
+    alpha : float
+        Significance threshold for decision error detection. Default 0.05.
+    one_tailed : bool
+        If True, compute one-tailed p-values. Default False.
+
+    Returns
+    -------
+    dict
+        Same keys as :func:`check_p_value`, with array values:
+        computed_p (ndarray), reported_p (ndarray or None), consistent
+        (bool ndarray or None), decision_error (bool ndarray or None),
+        and echoes of the inputs.
+
+    Examples
+    --------
+    >>> result = check_p_values('t', [2.20, 2.51], [28, 30],
+    ...                         reported_p=[0.04, 0.018])
+    >>> result['consistent']
+    array([False,  True])
+    """
+    test_type = test_type.lower()
+    statistics = np.asarray(statistics, dtype=float)
+    df1 = np.asarray(df1)
+
+    if test_type == "t":
+        computed_p = 2 * stats.t.sf(np.abs(statistics), df1)
+    elif test_type == "f":
+        if df2 is None:
+            raise ValueError("F-test requires df2 (denominator degrees of freedom)")
+        computed_p = stats.f.sf(statistics, df1, np.asarray(df2))
+    elif test_type in ("chi2", "q"):
+        computed_p = stats.chi2.sf(statistics, df1)
+    elif test_type == "z":
+        computed_p = 2 * stats.norm.sf(np.abs(statistics))
+    elif test_type == "r":
+        r_abs = np.abs(statistics)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_val = statistics * np.sqrt(df1) / np.sqrt(1 - statistics ** 2)
+            computed_p = 2 * stats.t.sf(np.abs(t_val), df1)
+        computed_p = np.where(r_abs >= 1.0,
+                              np.where(r_abs == 1.0, 0.0, np.nan),
+                              computed_p)
+    else:
+        raise ValueError(
+            f"Unknown test_type '{test_type}'. "
+            "Expected one of: 't', 'F', 'chi2', 'z', 'r', 'Q'"
+        )
+
+    if one_tailed:
+        computed_p = computed_p / 2
+
+    consistent = None
+    decision_error = None
+
+    if reported_p is not None:
+        reported_p = np.asarray(reported_p, dtype=float)
+        tolerance = np.array([_report_tolerance(p) for p in reported_p.ravel()])
+        tolerance = tolerance.reshape(reported_p.shape)
+        consistent = np.abs(computed_p - reported_p) <= tolerance
+        decision_error = (reported_p < alpha) != (computed_p < alpha)
+
+    return {
+        "computed_p": computed_p,
+        "reported_p": reported_p,
+        "consistent": consistent,
+        "decision_error": decision_error,
+        "test_type": test_type,
+        "statistic": statistics,
+        "df1": df1,
+        "df2": df2,
+    }
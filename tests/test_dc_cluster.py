@@ -7,7 +7,12 @@ import pytest
 pytest.importorskip("dcor", reason="dcor required")
 pytest.importorskip("scipy", reason="scipy required")
 
-from bullshit_detector.dc_cluster import dc_matrix, dist_corr, effective_k
+from bullshit_detector.dc_cluster import (
+    dc_matrix,
+    dc_matrix_gpu,
+    dist_corr,
+    effective_k,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -120,6 +125,41 @@ class TestDcMatrix:
         assert result.shape == (2, 2)
 
 
+class TestDcMatrixParallel:
+    def test_threaded_matches_serial(self, correlated_df):
+        serial = dc_matrix(correlated_df)
+        threaded = dc_matrix(correlated_df, n_jobs=-1)
+        np.testing.assert_array_equal(serial.values, threaded.values)
+
+
+class TestDcMatrixDtype:
+    def test_float32_matches_float64(self, correlated_df):
+        m32 = dc_matrix(correlated_df, dtype=np.float32)
+        m64 = dc_matrix(correlated_df)
+        assert m32.values.dtype == np.float32
+        assert m64.values.dtype == np.float64
+        np.testing.assert_allclose(m32.values, m64.values, atol=1e-5)
+
+
+# ---------------------------------------------------------------------------
+# dc_matrix_gpu tests
+# ---------------------------------------------------------------------------
+
+class TestDcMatrixGpu:
+    def test_matches_cpu_or_raises(self, correlated_df):
+        """With CuPy present the GPU matrix must match the CPU one (to
+        float32 tolerance); without it, the error must say how to fix it."""
+        try:
+            import cupy  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="CuPy"):
+                dc_matrix_gpu(correlated_df)
+        else:
+            gpu = dc_matrix_gpu(correlated_df)
+            cpu = dc_matrix(correlated_df)
+            np.testing.assert_allclose(gpu.values, cpu.values, atol=1e-5)
+
+
 # ---------------------------------------------------------------------------
 # effective_k tests
 # ---------------------------------------------------------------------------
@@ -161,6 +201,33 @@ class TestEffectiveK:
         tight = effective_k(correlated_df, threshold=0.01)
         assert loose["n_clusters"] <= tight["n_clusters"]
 
-    def test_dendrogram_data_is_dict(self, correlated_df):
+    def test_single_column_short_circuit(self, rng):
+        df = pd.DataFrame({"a": rng.normal(size=30)})
+        result = effective_k(df)
+        assert result["n_clusters"] == 1
+        assert list(result["cluster_labels"]) == [1]
+
+    def test_two_columns_match_full_pipeline(self, rng):
+        """The n=2 fast path must agree with scipy's linkage/fcluster."""
+        from scipy.cluster.hierarchy import fcluster, linkage
+
+        x = rng.normal(size=40)
+        df = pd.DataFrame({"a": x, "b": x * 2.0})        # dependent pair
+        df2 = pd.DataFrame({"a": x, "b": rng.normal(size=40)})  # independent
+        for frame in (df, df2):
+            for threshold in (0.05, 0.5, 0.99):
+                result = effective_k(frame, threshold=threshold)
+                dist = np.clip(1.0 - dc_matrix(frame).values, 0.0, None)
+                np.fill_diagonal(dist, 0.0)
+                Z = linkage(dist[np.triu_indices(2, k=1)], method="complete")
+                expected = fcluster(Z, t=threshold, criterion="distance")
+                assert result["n_clusters"] == expected.max()
+                assert list(result["cluster_labels"]) == list(expected)
+
+    def test_dendrogram_data_lazy_by_default(self, correlated_df):
         result = effective_k(correlated_df)
+        assert result["dendrogram_data"] is None
+
+    def test_dendrogram_data_is_dict_when_requested(self, correlated_df):
+        result = effective_k(correlated_df, return_dendrogram=True)
         assert isinstance(result["dendrogram_data"], dict)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from bullshit_detector.grimmer import a_grimmer
+from bullshit_detector.grimmer import a_grimmer, a_grimmer_batch
 
 
 class TestAGrimmer:
@@ -31,3 +31,30 @@ class TestAGrimmer:
         """n > 10^decimals_mean → GRIM cannot be applied."""
         result = a_grimmer(n=1000, mean=3.44, sd=2.47)
         assert result["grim_passed"] is None  # inapplicable, not a failure
+
+
+class TestAGrimmerBatch:
+    """Batched interface must agree with the scalar function row by row."""
+
+    def test_matches_scalar(self):
+        cases = [
+            (18, 3.44, 2.47),    # GRIMMER inconsistent
+            (10, 3.45, 1.50),    # GRIM inconsistent
+            (10, 3.40, 2.07),    # consistent
+            (1000, 3.44, 2.47),  # GRIM inapplicable
+        ]
+        ns, means, sds = zip(*cases)
+        batch = a_grimmer_batch(ns, means, sds)
+        assert len(batch) == len(cases)
+        for row, (n, mean, sd) in zip(batch, cases):
+            assert row == a_grimmer(n=n, mean=mean, sd=sd)
+
+    def test_sweep_matches_scalar(self):
+        """Exhaustive sweep over a small mean/SD grid."""
+        means = [round(0.01 * m, 2) for m in range(100, 500, 37)]
+        sds = [round(0.01 * s, 2) for s in range(50, 300, 43)]
+        cases = [(n, m, s) for n in (7, 12, 25) for m in means for s in sds]
+        ns, ms, ss = zip(*cases)
+        batch = a_grimmer_batch(ns, ms, ss)
+        for row, (n, mean, sd) in zip(batch, cases):
+            assert row == a_grimmer(n=n, mean=mean, sd=sd)
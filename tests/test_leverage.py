@@ -7,7 +7,11 @@ pytest.importorskip("statsmodels", reason="statsmodels required")
 pytest.importorskip("dcor", reason="dcor required")
 pytest.importorskip("matplotlib", reason="matplotlib required")
 
-from bullshit_detector.leverage import distance_correlation_test, influence_plot
+from bullshit_detector.leverage import (
+    DistanceCorrelation,
+    distance_correlation_test,
+    influence_plot,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -62,7 +66,17 @@ class TestInfluencePlot:
         x, y = linear_data
         result = influence_plot(x, y)
         assert set(result.keys()) == {"model", "cooks_distance", "high_leverage",
-                                      "high_residual", "cc"}
+                                      "high_residual", "is_high_leverage",
+                                      "is_high_residual", "cc"}
+
+    def test_masks_match_index_lists(self, outlier_data):
+        x, y = outlier_data
+        result = influence_plot(x, y)
+        np.testing.assert_array_equal(np.where(result["is_high_leverage"])[0],
+                                      result["high_leverage"])
+        np.testing.assert_array_equal(np.where(result["is_high_residual"])[0],
+                                      result["high_residual"])
+        assert len(result["is_high_leverage"]) == len(x)
 
     def test_cooks_distance_length(self, linear_data):
         x, y = linear_data
@@ -114,8 +128,8 @@ class TestInfluencePlot:
         result = influence_plot(x, y)
         expected_threshold = 4 / n
         hat = result["model"].get_influence().hat_matrix_diag
-        flagged = list(np.where(hat > expected_threshold)[0])
-        assert result["high_leverage"] == flagged
+        flagged = np.where(hat > expected_threshold)[0]
+        np.testing.assert_array_equal(result["high_leverage"], flagged)
 
 
 # ---------------------------------------------------------------------------
@@ -165,3 +179,29 @@ class TestDistanceCorrelationTest:
         x, y = independent_data
         result = distance_correlation_test(x, y, num_resamples=200)
         assert result["dcor"] < 0.3
+
+
+class TestDistanceCorrelationClass:
+    def test_dcor_matches_function(self, dependent_data):
+        x, y = dependent_data
+        dc = DistanceCorrelation(x, y)
+        result = distance_correlation_test(x, y, num_resamples=200)
+        assert dc.dcor == pytest.approx(result["dcor"])
+
+    def test_test_matches_function_with_same_rng(self, dependent_data):
+        x, y = dependent_data
+        dc = DistanceCorrelation(x, y)
+        from bullshit_detector.leverage import dcor_from_distance_matrices
+        dx = np.abs(x[:, None] - x[None, :])
+        dy = np.abs(y[:, None] - y[None, :])
+        expected = dcor_from_distance_matrices(dx, dy, num_resamples=200,
+                                               rng=np.random.default_rng(3))
+        result = dc.test(num_resamples=200, rng=np.random.default_rng(3))
+        assert result == expected
+
+    def test_repeated_tests_reuse_state(self, dependent_data):
+        x, y = dependent_data
+        dc = DistanceCorrelation(x, y)
+        r1 = dc.test(num_resamples=100)
+        r2 = dc.test(num_resamples=100)
+        assert r1["dcor"] == r2["dcor"] == dc.dcor
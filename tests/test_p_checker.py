@@ -1,6 +1,13 @@
 """Tests for p_checker module."""
 
-from bullshit_detector.p_checker import check_p_value
+import numpy as np
+import pytest
+
+from bullshit_detector.p_checker import (
+    check_p_value,
+    check_p_values,
+    make_checker,
+)
 
 
 def test_t_test_inconsistent():
@@ -41,3 +48,89 @@ def test_less_than_comparison():
     result = check_p_value("t", 2.5, 30, reported_p=0.05,
                            reported_comparison="<")
     assert result["consistent"] is True  # computed ≈ 0.018
+
+
+class TestCheckPValues:
+    def test_matches_scalar_t(self):
+        stats_ = [2.20, 1.5, 2.51]
+        dfs = [28, 20, 30]
+        ps = [0.04, 0.04, 0.018]
+        batch = check_p_values("t", stats_, dfs, reported_p=ps)
+        for i in range(3):
+            scalar = check_p_value("t", stats_[i], dfs[i], reported_p=ps[i])
+            assert batch["computed_p"][i] == pytest.approx(scalar["computed_p"])
+            assert bool(batch["consistent"][i]) == scalar["consistent"]
+            assert bool(batch["decision_error"][i]) == scalar["decision_error"]
+
+    def test_matches_scalar_f(self):
+        batch = check_p_values("F", [4.75, 2.1], [1, 2], df2=[145, 60])
+        for i, (s, d1, d2) in enumerate([(4.75, 1, 145), (2.1, 2, 60)]):
+            scalar = check_p_value("F", s, d1, d2)
+            assert batch["computed_p"][i] == pytest.approx(scalar["computed_p"])
+
+    def test_matches_scalar_r(self):
+        batch = check_p_values("r", [0.5, 1.0, -0.3], [20, 10, 25])
+        for i, (r, df) in enumerate([(0.5, 20), (1.0, 10), (-0.3, 25)]):
+            scalar = check_p_value("r", r, df)
+            assert batch["computed_p"][i] == pytest.approx(scalar["computed_p"])
+
+    def test_no_reported_p_gives_none(self):
+        batch = check_p_values("z", [1.96, 2.58], 0)
+        assert batch["consistent"] is None
+        assert batch["decision_error"] is None
+
+    def test_unknown_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown test_type"):
+            check_p_values("w", [1.0], [5])
+
+    def test_one_tailed(self):
+        two = check_p_values("t", [2.0], [30])
+        one = check_p_values("t", [2.0], [30], one_tailed=True)
+        np.testing.assert_allclose(one["computed_p"],
+                                   two["computed_p"] / 2)
+
+
+class TestReportTolerance:
+    def test_three_decimals(self):
+        from bullshit_detector.p_checker import _report_tolerance
+        assert _report_tolerance(0.031) == pytest.approx(0.0005)
+
+    def test_two_decimals(self):
+        from bullshit_detector.p_checker import _report_tolerance
+        assert _report_tolerance(0.04) == pytest.approx(0.005)
+
+    def test_scientific_notation(self):
+        """repr(1e-05) has no '.' — must not fall back to tolerance 0.5."""
+        from bullshit_detector.p_checker import _report_tolerance
+        assert _report_tolerance(1e-05) == pytest.approx(0.5e-5)
+
+
+class TestMakeChecker:
+    @pytest.mark.parametrize("test_type,args,stat", [
+        ("t", {"df1": 28}, 2.20),
+        ("F", {"df1": 1, "df2": 145}, 4.75),
+        ("chi2", {"df1": 3}, 7.81),
+        ("z", {}, 1.96),
+        ("r", {"df1": 20}, 0.5),
+        ("Q", {"df1": 5}, 11.07),
+    ])
+    def test_matches_check_p_value(self, test_type, args, stat):
+        checker = make_checker(test_type, **args)
+        expected = check_p_value(test_type, stat,
+                                 args.get("df1"), args.get("df2"),
+                                 reported_p=0.04)
+        result = checker(stat, reported_p=0.04)
+        assert result == expected
+
+    def test_f_requires_df2(self):
+        with pytest.raises(ValueError, match="df2"):
+            make_checker("F", df1=1)
+
+    def test_unknown_type_raises(self):
+        with pytest.raises(ValueError, match="Unknown test_type"):
+            make_checker("w", df1=5)
+
+    def test_comparison_passthrough(self):
+        checker = make_checker("t", df1=30)
+        result = checker(2.5, reported_p=0.05, reported_comparison="<")
+        assert result["consistent"] is True
@@ -0,0 +1,13 @@
+"""Tests for package-level helpers in bullshit_detector/__init__.py."""
+
+import bullshit_detector
+
+
+def test_version_string():
+    assert isinstance(bullshit_detector.__version__, str)
+
+
+def test_warmup_runs_and_is_idempotent():
+    """warmup() must succeed with or without numba and be safe to repeat."""
+    bullshit_detector.warmup()
+    bullshit_detector.warmup()
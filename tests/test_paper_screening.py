@@ -1,21 +1,38 @@
-"""Tests for paper screening module — validate API lookups."""
+"""Tests for paper screening module — validate API lookups.
+
+Shared lookups (Nature, the green coffee DOI, Bergstrom) come from
+session-scoped fixtures in conftest.py, so each identifier is fetched
+once per run no matter how many tests assert against it.
+"""
 
 import pytest
 
 from bullshit_detector.paper_screening import (
     check_journal,
+    check_paper,
     check_retraction,
+    check_retractions_batch,
     check_author,
+    screen_paper,
 )
 
+from conftest import CLEAN_DOI, RETRACTED_DOI
+
+# With pytest-recording installed, every test replays its cassette from
+# tests/cassettes/ (record with --record-mode=once); without it, the
+# mark is inert and the tests hit the live APIs as before. The network
+# mark lets CI split this latency-bound module from the CPU-bound
+# suites and fan it out with pytest-xdist:
+#   pytest -m network -n auto tests/test_paper_screening.py
+pytestmark = [pytest.mark.vcr, pytest.mark.network]
+
 
 class TestCheckJournal:
     """Test DOAJ + OpenAlex journal lookups."""
 
-    def test_known_good_journal(self):
+    def test_known_good_journal(self, nature_journal):
         """Nature should be found in OpenAlex with high citation count."""
-        result = check_journal("Nature")
-        assert result["works_count"] > 100000
+        assert nature_journal["works_count"] > 100000
 
     def test_predatory_journal(self):
         """Dove Press journal from Bergstrom & West example — result has correct shape."""
@@ -34,32 +51,43 @@ class TestCheckJournal:
 class TestCheckRetraction:
     """Test CrossRef + PubPeer lookups."""
 
-    def test_retracted_paper(self):
+    def test_retracted_paper(self, retracted_paper):
         """Green coffee extract paper should show retracted."""
-        result = check_retraction("10.2147/DMSO.S27665")
-        assert result["retracted"] is True
+        assert retracted_paper["retracted"] is True
 
-    def test_clean_paper(self):
+    def test_clean_paper(self, clean_paper):
         """A known-good paper should not be retracted."""
-        result = check_retraction("10.1038/s41586-020-2649-2")
-        assert result["retracted"] is False
+        assert clean_paper["retracted"] is False
 
-    def test_return_shape(self):
+    def test_return_shape(self, retracted_paper):
         """Result always has required keys."""
-        result = check_retraction("10.2147/DMSO.S27665")
         expected = {"retracted", "corrections", "pubpeer_comments", "pubpeer_url"}
-        assert expected.issubset(result.keys())
-        assert isinstance(result["corrections"], list)
+        assert expected.issubset(retracted_paper.keys())
+        assert isinstance(retracted_paper["corrections"], list)
+
+
+class TestCheckRetractionsBatch:
+    """Test the batched CrossRef DOI filter lookup."""
+
+    def test_mixed_batch(self):
+        """Retracted and clean DOIs resolved from one request."""
+        result = check_retractions_batch([RETRACTED_DOI, CLEAN_DOI])
+        assert result[RETRACTED_DOI.lower()]["retracted"] is True
+        assert result[CLEAN_DOI.lower()]["retracted"] is False
+
+    def test_keys_are_lowercased_inputs(self):
+        result = check_retractions_batch([RETRACTED_DOI])
+        assert set(result) == {RETRACTED_DOI.lower()}
+        assert isinstance(result[RETRACTED_DOI.lower()]["corrections"], list)
 
 
 class TestCheckAuthor:
     """Test OpenAlex author lookups."""
 
-    def test_prolific_author(self):
+    def test_prolific_author(self, bergstrom_author):
         """Well-known researcher should have substantial record."""
-        result = check_author("Carl T. Bergstrom")
-        assert result["works_count"] > 100
-        assert result["h_index"] > 20
+        assert bergstrom_author["works_count"] > 100
+        assert bergstrom_author["h_index"] > 20
 
     def test_unknown_author(self):
         """Author with minimal or no record should have low counts."""
@@ -72,3 +100,42 @@ class TestCheckAuthor:
         expected = {"works_count", "cited_by_count", "h_index", "institution", "top_fields", "orcid"}
         assert expected.issubset(result.keys())
         assert isinstance(result["top_fields"], list)
+
+
+class TestCheckPaper:
+    """Test the single-request OpenAlex works lookup."""
+
+    def test_retracted_paper(self):
+        """Green coffee extract paper — venue and retraction from one response."""
+        result = check_paper(RETRACTED_DOI)
+        assert result["retracted"] is True
+        assert result["journal"] is not None
+        assert result["authors"]  # Vinson, Burnham, Nagendran
+
+    def test_return_shape(self):
+        """Result always has all required keys, even for a bogus DOI."""
+        result = check_paper("10.9999/does-not-exist-99999")
+        expected = {"title", "retracted", "cited_by_count", "journal",
+                    "publisher", "issn", "journal_is_oa", "authors",
+                    "first_author_institution"}
+        assert expected.issubset(result.keys())
+        assert isinstance(result["authors"], list)
+
+
+class TestScreenPaper:
+    """Test the concurrent Tier 0 façade."""
+
+    def test_all_checks_run(self):
+        """All three keys present when all inputs are given."""
+        result = screen_paper(
+            journal="Nature",
+            doi=RETRACTED_DOI,
+            author="Carl T. Bergstrom",
+        )
+        assert set(result.keys()) == {"journal", "retraction", "author"}
+        assert result["retraction"]["retracted"] is True
+
+    def test_omitted_inputs_omitted_from_result(self):
+        """Checks without input are skipped, not stubbed."""
+        result = screen_paper(doi=CLEAN_DOI)
+        assert set(result.keys()) == {"retraction"}
@@ -2,8 +2,7 @@
 
 import pytest
 
-from bullshit_detector.power import required_n, achieved_power
-# power_curve imported when implemented
+from bullshit_detector.power import required_n, achieved_power, power_curve
 
 
 class TestRequiredN:
@@ -60,3 +59,43 @@ class TestAchievedPower:
                                   n_per_group=n_result["n_per_group"],
                                   alpha=0.05)
         assert abs(p_result["power"] - 0.80) < 0.02
+
+
+class TestPowerCurve:
+    """Test the vectorized power/sample-size curves."""
+
+    def test_d_range_matches_required_n(self):
+        """Each row of the Speidel sensitivity table matches required_n."""
+        df = power_curve(d_range=(10, 22, 2), sd1=16, sd2=12,
+                         alpha=0.10, power=0.80)
+        assert list(df.columns) == ["d", "n_per_group", "n_total"]
+        for _, row in df.iterrows():
+            scalar = required_n(d=row["d"], sd1=16, sd2=12,
+                                alpha=0.10, power=0.80)
+            assert row["n_per_group"] == scalar["n_per_group"]
+            assert row["n_total"] == 2 * row["n_per_group"]
+
+    def test_n_range_matches_achieved_power(self):
+        """Each row of the power curve matches achieved_power."""
+        df = power_curve(n_range=(5, 50, 5), effect_size=0.5)
+        assert list(df.columns) == ["n_per_group", "power"]
+        for _, row in df.iterrows():
+            scalar = achieved_power(effect_size=0.5,
+                                    n_per_group=int(row["n_per_group"]))
+            assert row["power"] == pytest.approx(scalar["power"], abs=1e-9)
+
+    def test_power_increases_with_n(self):
+        df = power_curve(n_range=(5, 100, 5), effect_size=0.5)
+        assert df["power"].is_monotonic_increasing
+
+    def test_exactly_one_mode_required(self):
+        with pytest.raises(ValueError):
+            power_curve()
+        with pytest.raises(ValueError):
+            power_curve(d_range=(0.2, 1.0, 0.2), n_range=(5, 50, 5))
+
+    def test_n_range_requires_effect(self):
+        with pytest.raises(ValueError):
+            power_curve(n_range=(5, 50, 5))
+        with pytest.raises(ValueError):
+            power_curve(n_range=(5, 50, 5), d=16)  # raw d without sd
@@ -1,62 +1,65 @@
 """Tests for redundancy analysis module."""
 
 import numpy as np
-import pandas as pd
 import pytest
 
 from bullshit_detector.redundancy import redundancy_analysis, suggest_removal
 
 
-# ---------------------------------------------------------------------------
-# Synthetic dataset that mirrors the Hunt (2013) structure used by Speidel:
-#   - gross.pay          : measured variable
-#   - gross.pay.transform: algebraically derived (log transform) → highly redundant
-#   - phi.h              : independent measured variable
-#   - random.1/2         : pure noise → should NOT be flagged
-# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def hunt_like():
+    """Synthetic dataset mirroring the Hunt (2013) structure used by Speidel.
 
-RNG = np.random.default_rng(42)
-N = 50
-_gross_pay = RNG.uniform(5, 80, size=N)
+    - gross.pay          : measured variable
+    - gross.pay.transform: algebraically derived (log transform) → highly redundant
+    - phi.h              : independent measured variable
+    - random.1/2         : pure noise → should NOT be flagged
 
-HUNT_LIKE = pd.DataFrame({
-    "gross.pay":           _gross_pay,
-    "gross.pay.transform": np.log1p(_gross_pay) + RNG.normal(0, 0.05, N),  # near-perfect
-    "phi.h":               RNG.uniform(0.1, 0.4, size=N),
-    "random.1":            RNG.standard_normal(N),
-    "random.2":            RNG.standard_normal(N),
-})
+    Built lazily so pandas is only imported when these tests actually run.
+    """
+    import pandas as pd
+
+    rng = np.random.default_rng(42)
+    n = 50
+    gross_pay = rng.uniform(5, 80, size=n)
+    return pd.DataFrame({
+        "gross.pay":           gross_pay,
+        "gross.pay.transform": np.log1p(gross_pay) + rng.normal(0, 0.05, n),  # near-perfect
+        "phi.h":               rng.uniform(0.1, 0.4, size=n),
+        "random.1":            rng.standard_normal(n),
+        "random.2":            rng.standard_normal(n),
+    })
 
 
 class TestRedundancyAnalysis:
     """Validate against Speidel (2018) R results."""
 
-    def test_algebraic_redundancy(self):
+    def test_algebraic_redundancy(self, hunt_like):
         """gross.pay.transform should be highly redundant (algebraically derived)."""
-        result = redundancy_analysis(HUNT_LIKE, r2_threshold=0.70)
+        result = redundancy_analysis(hunt_like, r2_threshold=0.70)
         assert "gross.pay.transform" in result["redundant"]
 
-    def test_random_variables_not_redundant(self):
+    def test_random_variables_not_redundant(self, hunt_like):
         """random.1 and random.2 should NOT be redundant."""
-        result = redundancy_analysis(HUNT_LIKE, r2_threshold=0.70)
+        result = redundancy_analysis(hunt_like, r2_threshold=0.70)
         assert "random.1" not in result["redundant"]
         assert "random.2" not in result["redundant"]
 
-    def test_effective_k_less_than_total(self):
+    def test_effective_k_less_than_total(self, hunt_like):
         """effective_k should be less than total number of variables."""
-        result = redundancy_analysis(HUNT_LIKE, r2_threshold=0.70)
-        assert result["effective_k"] < HUNT_LIKE.shape[1]
+        result = redundancy_analysis(hunt_like, r2_threshold=0.70)
+        assert result["effective_k"] < hunt_like.shape[1]
 
-    def test_high_threshold_retains_all(self):
+    def test_high_threshold_retains_all(self, hunt_like):
         """With r2_threshold=0.99, only the algebraically-derived column is flagged."""
-        result = redundancy_analysis(HUNT_LIKE, r2_threshold=0.99)
+        result = redundancy_analysis(hunt_like, r2_threshold=0.99)
         # gross.pay.transform is near-perfect (r2 > 0.99 via log transform + tiny noise)
         # All others should be retained
-        assert result["effective_k"] >= HUNT_LIKE.shape[1] - 1
+        assert result["effective_k"] >= hunt_like.shape[1] - 1
 
-    def test_return_shape(self):
+    def test_return_shape(self, hunt_like):
         """Result always contains all required keys."""
-        result = redundancy_analysis(HUNT_LIKE)
+        result = redundancy_analysis(hunt_like)
         expected = {"r_squared", "redundant", "retained", "effective_k", "threshold"}
         assert expected.issubset(result.keys())
         assert isinstance(result["r_squared"], dict)
@@ -64,8 +67,33 @@ class TestRedundancyAnalysis:
         assert isinstance(result["retained"], list)
         assert result["effective_k"] == len(result["retained"])
 
-    def test_suggest_removal(self):
+    def test_suggest_removal(self, hunt_like):
         """suggest_removal returns redundant cols ordered by R² descending."""
-        result = redundancy_analysis(HUNT_LIKE, r2_threshold=0.70)
+        result = redundancy_analysis(hunt_like, r2_threshold=0.70)
         to_remove = suggest_removal(result)
         assert to_remove == result["redundant"]
+
+    def test_ndarray_input_matches_dataframe(self, hunt_like):
+        """A plain ndarray with names gives the same result as the DataFrame."""
+        from_df = redundancy_analysis(hunt_like, r2_threshold=0.70)
+        from_arr = redundancy_analysis(hunt_like.values, r2_threshold=0.70,
+                                       names=list(hunt_like.columns))
+        assert from_arr == from_df
+
+    def test_constant_column_gets_zero_r_squared(self, hunt_like):
+        """A zero-variance column gets R²=0.0 and leaves the rest valid."""
+        data = hunt_like.copy()
+        data["constant"] = 1.0
+        result = redundancy_analysis(data, r2_threshold=0.70)
+        assert result["r_squared"]["constant"] == 0.0
+        assert "constant" in result["retained"]
+        assert not any(np.isnan(v) for v in result["r_squared"].values())
+        # the varying columns behave as without the constant column
+        assert "gross.pay.transform" in result["redundant"]
+        assert "random.1" not in result["redundant"]
+
+    def test_ndarray_default_names(self):
+        """Unnamed ndarray columns are labelled var0, var1, ..."""
+        rng = np.random.default_rng(0)
+        result = redundancy_analysis(rng.standard_normal((30, 3)))
+        assert set(result["r_squared"]) == {"var0", "var1", "var2"}
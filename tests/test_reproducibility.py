@@ -3,7 +3,13 @@
 import numpy as np
 import pytest
 
-from bullshit_detector.reproducibility import bootstrap_proportion, error_flag
+from bullshit_detector.reproducibility import (
+    blb_proportion,
+    bootstrap_proportion,
+    bootstrap_proportion_sweep,
+    error_flag,
+    error_flag_batch,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -15,7 +21,7 @@ class TestErrorFlag:
         x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
         result = error_flag(x, x)
         assert result["n_flagged"] == 0
-        assert result["flagged_points"] == []
+        assert result["flagged_points"].size == 0
         assert result["fraction_flagged"] == 0.0
 
     def test_perfect_match_zero_abs_errors(self):
@@ -42,7 +48,7 @@ class TestErrorFlag:
         actual    = np.array([0.5, 1.5, 0.3])
         result = error_flag(predicted, actual, threshold=1.0)
         # Only index 1 has abs_error = 1.5 > 1.0
-        assert result["flagged_points"] == [1]
+        np.testing.assert_array_equal(result["flagged_points"], [1])
         assert result["n_flagged"] == 1
         assert result["fraction_flagged"] == pytest.approx(1 / 3)
 
@@ -70,7 +76,7 @@ class TestErrorFlag:
         predicted = np.array([1.0, 2.0, 3.0, 4.0])
         actual    = np.array([2.0, 3.0, 4.0, 5.0])
         result = error_flag(predicted, actual)
-        assert result["slope_sign_mismatches"] == []
+        assert result["slope_sign_mismatches"].size == 0
 
     def test_accepts_lists(self):
         result = error_flag([1.0, 2.0, 3.0], [1.0, 2.0, 3.0])
@@ -94,6 +100,42 @@ class TestErrorFlag:
         assert len(result["slope_sign_mismatches"]) >= 2
 
 
+# ---------------------------------------------------------------------------
+# error_flag_batch tests
+# ---------------------------------------------------------------------------
+
+class TestErrorFlagBatch:
+    def test_rows_match_scalar_error_flag(self):
+        rng = np.random.default_rng(0)
+        predicted = rng.normal(size=(4, 30))
+        actual = rng.normal(size=(4, 30))
+        batch = error_flag_batch(predicted, actual, threshold=0.5)
+        for i in range(4):
+            single = error_flag(predicted[i], actual[i], threshold=0.5)
+            np.testing.assert_array_equal(batch["abs_errors"][i],
+                                          single["abs_errors"])
+            assert batch["n_flagged"][i] == single["n_flagged"]
+            assert batch["fraction_flagged"][i] == pytest.approx(
+                single["fraction_flagged"])
+            assert batch["n_slope_sign_mismatches"][i] == len(
+                single["slope_sign_mismatches"])
+
+    def test_output_shapes(self):
+        x = np.zeros((3, 5))
+        result = error_flag_batch(x, x + 1.0, threshold=0.5)
+        assert result["abs_errors"].shape == (3, 5)
+        assert result["n_flagged"].shape == (3,)
+        assert np.all(result["n_flagged"] == 5)
+
+    def test_rejects_1d_input(self):
+        with pytest.raises(ValueError):
+            error_flag_batch(np.zeros(5), np.zeros(5))
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            error_flag_batch(np.zeros((2, 5)), np.zeros((2, 6)))
+
+
 # ---------------------------------------------------------------------------
 # bootstrap_proportion tests
 # ---------------------------------------------------------------------------
@@ -186,3 +228,102 @@ class TestBootstrapProportion:
                                       n_boot=500, random_state=0)
         # ~49 of 100 values exceed 0.5
         assert 0.45 < result["proportion"] < 0.55
+
+
+# ---------------------------------------------------------------------------
+# bootstrap_proportion_sweep tests
+# ---------------------------------------------------------------------------
+
+class TestBootstrapProportionSweep:
+    def test_proportions_match_scalar(self):
+        rng = np.random.default_rng(0)
+        abs_errors = rng.exponential(size=200)
+        thresholds = np.array([0.1, 0.5, 1.0, 2.0])
+        sweep = bootstrap_proportion_sweep(abs_errors, thresholds,
+                                           n_boot=500, random_state=0)
+        for t, p in zip(thresholds, sweep["proportions"]):
+            single = bootstrap_proportion(abs_errors, lambda x: x > t,
+                                          n_boot=500, random_state=0)
+            assert p == pytest.approx(single["proportion"])
+
+    def test_output_shapes_and_ordering(self):
+        abs_errors = np.linspace(0, 1, 50)
+        thresholds = np.array([0.25, 0.5, 0.75])
+        sweep = bootstrap_proportion_sweep(abs_errors, thresholds,
+                                           n_boot=2000, random_state=1)
+        assert sweep["proportions"].shape == (3,)
+        assert np.all(sweep["ci_lower"] <= sweep["proportions"])
+        assert np.all(sweep["proportions"] <= sweep["ci_upper"])
+        # higher threshold flags fewer points
+        assert np.all(np.diff(sweep["proportions"]) <= 0)
+
+    def test_reproducible_with_random_state(self):
+        abs_errors = np.random.default_rng(2).exponential(size=100)
+        a = bootstrap_proportion_sweep(abs_errors, [0.5, 1.0],
+                                       n_boot=500, random_state=9)
+        b = bootstrap_proportion_sweep(abs_errors, [0.5, 1.0],
+                                       n_boot=500, random_state=9)
+        np.testing.assert_array_equal(a["ci_lower"], b["ci_lower"])
+        np.testing.assert_array_equal(a["ci_upper"], b["ci_upper"])
+
+
+# ---------------------------------------------------------------------------
+# Clopper-Pearson method tests
+# ---------------------------------------------------------------------------
+
+class TestClopperPearson:
+    def test_ci_close_to_bootstrap(self):
+        data = np.array([1] * 70 + [0] * 30)
+        cp = bootstrap_proportion(data, lambda x: x == 1,
+                                  method="clopper-pearson")
+        bs = bootstrap_proportion(data, lambda x: x == 1,
+                                  n_boot=20000, random_state=0)
+        assert cp["proportion"] == pytest.approx(0.7)
+        assert cp["ci_lower"] == pytest.approx(bs["ci_lower"], abs=0.05)
+        assert cp["ci_upper"] == pytest.approx(bs["ci_upper"], abs=0.05)
+        assert cp["n_boot"] == 0
+        assert cp["bootstrap_proportions"] is None
+
+    def test_degenerate_proportions(self):
+        all_true = bootstrap_proportion(np.ones(50), lambda x: x > 0,
+                                        method="clopper-pearson")
+        assert all_true["ci_upper"] == 1.0
+        assert 0.9 < all_true["ci_lower"] < 1.0
+        none_true = bootstrap_proportion(np.zeros(50), lambda x: x > 0,
+                                         method="clopper-pearson")
+        assert none_true["ci_lower"] == 0.0
+        assert 0.0 < none_true["ci_upper"] < 0.1
+
+    def test_unknown_method_raises(self):
+        with pytest.raises(ValueError):
+            bootstrap_proportion(np.ones(5), lambda x: x > 0, method="jackknife")
+
+
+# ---------------------------------------------------------------------------
+# Bag of Little Bootstraps tests
+# ---------------------------------------------------------------------------
+
+class TestBLBProportion:
+    def test_ci_close_to_full_bootstrap(self):
+        data = np.random.default_rng(0).normal(size=20000)
+        blb = blb_proportion(data, lambda x: x > 0.5, random_state=1)
+        bs = bootstrap_proportion(data, lambda x: x > 0.5,
+                                  n_boot=5000, random_state=1)
+        assert blb["proportion"] == bs["proportion"]
+        assert blb["ci_lower"] == pytest.approx(bs["ci_lower"], abs=0.01)
+        assert blb["ci_upper"] == pytest.approx(bs["ci_upper"], abs=0.01)
+        assert blb["ci_lower"] < blb["proportion"] < blb["ci_upper"]
+
+    def test_output_shapes(self):
+        data = np.random.default_rng(1).normal(size=5000)
+        result = blb_proportion(data, lambda x: x > 0, s=10, r=25,
+                                random_state=2)
+        assert result["n_boot"] == 250
+        assert result["bootstrap_proportions"].shape == (250,)
+
+    def test_reproducible_with_random_state(self):
+        data = np.random.default_rng(3).normal(size=5000)
+        a = blb_proportion(data, lambda x: x > 0, random_state=7)
+        b = blb_proportion(data, lambda x: x > 0, random_state=7)
+        assert a["ci_lower"] == b["ci_lower"]
+        assert a["ci_upper"] == b["ci_upper"]